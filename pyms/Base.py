@@ -27,6 +27,7 @@ Base for PyMassSpec classes.
 import typing
 import pathlib
 import os
+import pickle
 
 # this package
 from pyms.Utils.IO import prepare_filepath
@@ -41,12 +42,17 @@ class pymsBaseClass:
     Base class.
     """
 
-    def dump(self, file_name: PathLike, protocol: int = 3):
+    # Empty so that subclasses which define ``__slots__`` don't get a ``__dict__``.
+    __slots__ = ()
+
+    def dump(self, file_name: PathLike, protocol: int = pickle.HIGHEST_PROTOCOL):
         """
         Dumps an object to a file through :func:`pickle.dump()`.
 
         :param file_name: Filename to save the dump as.
         :param protocol: The pickle protocol to use.
+            Defaults to the highest protocol available, which on Python 3.8 and later
+            writes the numpy arrays without an intermediate copy.
 
         :authors: Vladimir Likic, Dominic Davis-Foster (pathlib and pickle protocol support)
         """  # noqa: D402  # TODO: False positive
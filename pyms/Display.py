@@ -24,20 +24,15 @@ Class to Display Ion Chromatograms and TIC.
 ################################################################################
 
 # stdlib
+import itertools
 import warnings
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union
 
 # 3rd party
-import deprecation  # type: ignore
-import matplotlib  # type: ignore
-import matplotlib.pyplot as plt  # type: ignore
-from matplotlib.axes import Axes  # type: ignore
-from matplotlib.container import BarContainer  # type: ignore
-from matplotlib.figure import Figure  # type: ignore
-from matplotlib.lines import Line2D  # type: ignore
+import numpy  # type: ignore
 
 # this package
-from pyms import Peak, __version__
+from pyms import Peak
 from pyms.IonChromatogram import IonChromatogram
 from pyms.Peak.List.Function import is_peak_list
 from pyms.Spectrum import MassSpectrum, normalize_mass_spec
@@ -45,6 +40,7 @@ from pyms.Spectrum import MassSpectrum, normalize_mass_spec
 __all__ = [
 		"Display",
 		"plot_ic",
+		"plot_ics",
 		"plot_mass_spec",
 		"plot_head2tail",
 		"plot_peaks",
@@ -53,10 +49,21 @@ __all__ = [
 		]
 
 default_filetypes = ["png", "pdf", "svg"]
+_raster_filetypes = {"png", "jpg", "jpeg"}
+_display_deprecation_warned = False
 
-# Ensure that the intersphinx links are correct.
-Axes.__module__ = "matplotlib.axes"
-Figure.__module__ = "matplotlib.figure"
+# matplotlib is imported where it is used, as importing it (particularly
+# matplotlib.pyplot) is slow and not every user of this module plots.
+if TYPE_CHECKING:
+	# 3rd party
+	from matplotlib.axes import Axes  # type: ignore
+	from matplotlib.collections import LineCollection  # type: ignore
+	from matplotlib.figure import Figure  # type: ignore
+	from matplotlib.lines import Line2D  # type: ignore
+
+	# Ensure that the intersphinx links are correct.
+	Axes.__module__ = "matplotlib.axes"
+	Figure.__module__ = "matplotlib.figure"
 
 
 class Display:
@@ -80,39 +87,64 @@ class Display:
 	:author: Sean O'Callaghan
 	:author: Vladimir Likic
 	:author: Dominic Davis-Foster
+
+	.. deprecated:: 2.2.8
+		This will be removed in 2.4.0. Functionality has moved to other functions and classes in this module.
 	"""  # noqa: D400
 
-	@deprecation.deprecated(
-			"2.2.8",
-			"2.4.0",
-			current_version=__version__,
-			details="Functionality has moved to other functions and classes in this module.",
-			)
-	def __init__(self, fig: Figure = None, ax: Axes = None):
+	def __init__(self, fig: "Figure" = None, ax: "Axes" = None):
+		# 3rd party
+		import matplotlib.pyplot as plt  # type: ignore
+		from matplotlib.axes import Axes  # type: ignore
+		from matplotlib.figure import Figure  # type: ignore
+
+		global _display_deprecation_warned
+
+		# Only warn the first time, rather than on every instantiation
+		if not _display_deprecation_warned:
+			warnings.warn(
+					"__init__ is deprecated as of 2.2.8 and will be removed in 2.4.0. "
+					"Functionality has moved to other functions and classes in this module.",
+					DeprecationWarning,
+					stacklevel=2,
+					)
+			_display_deprecation_warned = True
 
 		if fig is None:
 			fig = plt.figure()
 			ax = fig.add_subplot(111)
 
-		elif isinstance(fig, matplotlib.figure.Figure) and ax is None:
+		elif isinstance(fig, Figure) and ax is None:
 			ax = fig.add_subplot(111)
 
-		if not isinstance(fig, matplotlib.figure.Figure):
+		if not isinstance(fig, Figure):
 			raise TypeError("'fig' must be a matplotlib.figure.Figure object")
 
-		if not isinstance(ax, matplotlib.axes.Axes):
+		if not isinstance(ax, Axes):
 			raise TypeError("'ax' must be a matplotlib.axes.Axes object")
 
 		self.fig = fig
 		self.ax = ax
 
 		# Container to store plots
-		self.__tic_ic_plots: List[List[Line2D]] = []
+		self.__tic_ic_plots: List[List[Union["Line2D", "LineCollection"]]] = []
 
-		# Peak list container
+		# Peak list container, and its retention times in ascending order for onclick
 		self.__peak_list: List[Peak.Peak] = []
+		self.__sorted_rts, self.__rt_order = _sort_peak_rts(self.__peak_list)
+
+		# Mass spectra of peaks that have been clicked on, by index in the peak list
+		self.__mass_spectra: Dict[int, MassSpectrum] = {}
 
-	def do_plotting(self, plot_label: Optional[str] = None):
+		# Connection id of the mouse click callback, if any
+		self._click_cid: Optional[int] = None
+
+		# Whether anything has been plotted since the last call to do_plotting,
+		# and the labels and location the current legend was built with
+		self._dirty = False
+		self._legend_key: Optional[Tuple[Tuple[str, ...], str]] = None
+
+	def do_plotting(self, plot_label: Optional[str] = None, legend_loc: str = "upper right"):
 		"""
 		Plots TIC and IC(s) if they have been created by
 		:meth:`~pyms.Display.Display.plot_tic` or
@@ -121,7 +153,12 @@ class Display:
 		Also adds detected peaks if they have been added by
 		:meth:`~pyms.Display.Display.plot_peaks`
 
+		If nothing has been plotted and neither the label nor the legend has changed
+		since the last call, the figure is not redrawn.
+
 		:param plot_label: Label for the plot to show e.g. the data origin
+		:param legend_loc: The location of the legend. ``'best'`` is avoided by default
+			as it has to check every plotted point, which is slow for large chromatograms.
 		"""  # noqa: D400
 
 		# if no plots have been created advise user
@@ -133,16 +170,31 @@ Please call a plotting function before calling 'do_plotting()'""",
 					)
 			return
 
-		if plot_label is not None:
+		if plot_label is not None and plot_label != self.ax.get_title():
 			self.ax.set_title(plot_label)
+			self._dirty = True
 
-		self.ax.legend()
+		# Only rebuild the legend when its entries or location have changed
+		legend_key = (tuple(self.ax.get_legend_handles_labels()[1]), legend_loc)
+		if legend_key != self._legend_key or self.ax.get_legend() is None:
+			self.ax.legend(loc=legend_loc)
+			self._legend_key = legend_key
+			self._dirty = True
+
+		if not self._dirty:
+			return
 
 		self.fig.canvas.draw()
+		self._dirty = False
+
+		# Disconnect any previous callback so each click is only handled once
+		if self._click_cid is not None:
+			self.fig.canvas.mpl_disconnect(self._click_cid)
+			self._click_cid = None
 
 		# If no peak list plot, no mouse click event
-		if len(self.__peak_list) != 0:
-			self.fig.canvas.mpl_connect("button_press_event", self.onclick)
+		if self.__peak_list:
+			self._click_cid = self.fig.canvas.mpl_connect("button_press_event", self.onclick)
 
 	# plt.show()
 
@@ -154,21 +206,7 @@ Please call a plotting function before calling 'do_plotting()'""",
 		:param intensity_list: List of Ion intensities
 		"""
 
-		largest = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
-
-		# Find out largest value
-		for idx, intensity in enumerate(intensity_list):
-			if intensity > intensity_list[largest[0]]:
-				largest[0] = idx
-
-		# Now find next four largest values
-		for j in [1, 2, 3, 4, 5, 6, 7, 8, 9]:
-			for idx, intensity in enumerate(intensity_list):
-				# if intensity_list[i] > intensity_list[largest[j]] and intensity_list[i] < intensity_list[largest[j-1]]:
-				if intensity_list[largest[j]] < intensity < intensity_list[largest[j - 1]]:
-					largest[j] = idx
-
-		return largest
+		return _top_n_indices(intensity_list, 5)
 
 	def onclick(self, event):
 		"""
@@ -182,18 +220,24 @@ Please call a plotting function before calling 'do_plotting()'""",
 		intensity_list = []
 		mass_list = []
 
-		for peak in self.__peak_list:
-			# if event.xdata > 0.9999*peak.rt and event.xdata < 1.0001*peak.rt:
-			if 0.9999 * peak.rt < event.xdata < 1.0001 * peak.rt:
-				intensity_list = peak.mass_spectrum.mass_spec
-				mass_list = peak.mass_spectrum.mass_list
+		peak_idx = _find_peak_index(self.__sorted_rts, self.__rt_order, event.xdata, 0.9999, 1.0001)
+
+		if peak_idx is not None:
+			if peak_idx not in self.__mass_spectra:
+				self.__mass_spectra[peak_idx] = self.__peak_list[peak_idx].mass_spectrum
+			mass_spectrum = self.__mass_spectra[peak_idx]
+			intensity_list = numpy.asarray(mass_spectrum.mass_spec)
+			mass_list = numpy.asarray(mass_spectrum.mass_list)
 
 		largest = self.get_5_largest(intensity_list)
 
 		if len(intensity_list) != 0:
-			print("mass\t intensity")
-			for i in range(10):
-				print(mass_list[largest[i]], '\t', intensity_list[largest[i]])
+			# Index all the selected channels at once and print in a single call
+			lines = "\n".join(
+					f"{mass} \t {intensity}"
+					for mass, intensity in zip(mass_list[largest], intensity_list[largest])
+					)
+			print(f"mass\t intensity\n{lines}")
 		else:  # if the selected point is not close enough to peak
 			print("No Peak at this point")
 
@@ -223,6 +267,27 @@ Please call a plotting function before calling 'do_plotting()'""",
 
 		plot = plot_ic(self.ax, ic, **kwargs)
 		self.__tic_ic_plots.append(plot)
+		self._dirty = True
+		return plot
+
+	def plot_ics(self, ics: Sequence[IonChromatogram], minutes: bool = False, **kwargs):
+		"""
+		Plots several Ion Chromatograms as a single collection of lines.
+
+		:param ics: Ion Chromatograms to plot
+		:param minutes: Whether to show the time in minutes.
+
+		:Other Parameters: :class:`matplotlib.collections.LineCollection` properties.
+			Used to specify properties like a label (for auto legends),
+			colors, linewidths, antialiasing.
+
+			See https://matplotlib.org/3.1.1/api/collections_api.html#matplotlib.collections.LineCollection
+			for the list of possible kwargs
+		"""
+
+		plot = plot_ics(self.ax, ics, minutes, **kwargs)
+		self.__tic_ic_plots.append([plot])
+		self._dirty = True
 		return plot
 
 	def plot_mass_spec(self, mass_spec: MassSpectrum, **kwargs):
@@ -231,20 +296,22 @@ Please call a plotting function before calling 'do_plotting()'""",
 
 		:param mass_spec: The mass spectrum at a given time/index
 
-		:Other Parameters: :class:`matplotlib.lines.Line2D` properties.
+		:Other Parameters: :class:`matplotlib.collections.LineCollection` properties.
 			Used to specify properties like a line label (for auto legends),
-			linewidth, antialiasing, marker face color.
+			alpha, antialiasing, color. ``width`` sets the width of the
+			stems and defaults to ``0.5``.
 
 			Example::
 
-			>>> plot_mass_spec(im.get_ms_at_index(5), linewidth=2)
+			>>> plot_mass_spec(im.get_ms_at_index(5), width=2)
 			>>>	ax.set_title(f"Mass spec for peak at time {im.get_time_at_index(5):5.2f}")
 
-			See https://matplotlib.org/3.1.1/api/_as_gen/matplotlib.lines.Line2D.html
+			See https://matplotlib.org/3.1.1/api/collections_api.html#matplotlib.collections.LineCollection
 			for the list of possible kwargs
 		"""
 
 		plot = plot_mass_spec(self.ax, mass_spec, **kwargs)
+		self._dirty = True
 		return plot
 
 	def plot_peaks(self, peak_list: List[Peak.Peak], label: str = "Peaks"):
@@ -259,6 +326,9 @@ Please call a plotting function before calling 'do_plotting()'""",
 
 		# Copy to self.__peak_list for onclick event handling
 		self.__peak_list = peak_list
+		self.__sorted_rts, self.__rt_order = _sort_peak_rts(peak_list)
+		self.__mass_spectra = {}
+		self._dirty = True
 
 		return plot
 
@@ -286,18 +356,29 @@ Please call a plotting function before calling 'do_plotting()'""",
 
 		plot = plot_ic(self.ax, tic, minutes, **kwargs)
 		self.__tic_ic_plots.append(plot)
+		self._dirty = True
 		return plot
 
-	def save_chart(self, filepath: str, filetypes: Optional[List[str]] = None):
+	def save_chart(self, filepath: str, filetypes: Optional[List[str]] = None, dpi: Optional[float] = None):
 		"""
 		Save the chart to the given path with the given filetypes.
 
+		The chromatogram lines are rasterized, so vector formats such as PDF and SVG
+		embed an image of each line rather than every point, while the axes and labels
+		remain as vectors. Where possible the figure is rendered only once for all the
+		raster formats (PNG and JPEG), which are then written from the same image.
+
 		:param filepath: Path and filename to save the chart as. Should not include extension.
 		:param filetypes: List of filetypes to use.
+		:param dpi: The resolution of raster output and of the rasterized lines.
+			Defaults to :rc:`savefig.dpi`.
 
 		:author: Dominic Davis-Foster
 		"""
 
+		# 3rd party
+		import matplotlib.pyplot as plt  # type: ignore
+
 		# TODO: pathlib and remove extension if given & use that as filetype
 
 		if filetypes is None:
@@ -305,11 +386,64 @@ Please call a plotting function before calling 'do_plotting()'""",
 
 		# matplotlib.use("Agg")
 
+		for plot in self.__tic_ic_plots:
+			for line in plot:
+				line.set_rasterized(True)
+
+		raster_image = None
+		if any(filetype.lower() in _raster_filetypes for filetype in filetypes):
+			raster_image = self._render_raster_image(dpi)
+
 		for filetype in filetypes:
-			# plt.savefig(filepath + ".{}".format(filetype))
-			self.fig.savefig(filepath + f".{filetype}")
+			if raster_image is not None and filetype.lower() in _raster_filetypes:
+				image = raster_image if filetype.lower() == "png" else raster_image.convert("RGB")
+				image.save(filepath + f".{filetype}")
+			else:
+				# plt.savefig(filepath + ".{}".format(filetype))
+				self.fig.savefig(filepath + f".{filetype}", dpi=dpi)
 		plt.close()
 
+	def _render_raster_image(self, dpi: Optional[float] = None):
+		"""
+		Render the figure once with the Agg canvas, for writing to several raster formats.
+
+		:param dpi: The resolution requested for the output.
+
+		:return: A :class:`PIL.Image.Image`, or :py:obj:`None` if the output of
+			:meth:`~matplotlib.figure.Figure.savefig` would differ from the canvas, in which
+			case each file should be saved with :meth:`~matplotlib.figure.Figure.savefig`.
+		"""
+
+		# 3rd party
+		import matplotlib  # type: ignore
+		from matplotlib.backends.backend_agg import FigureCanvasAgg  # type: ignore
+		from matplotlib.colors import to_rgba  # type: ignore
+
+		try:
+			# 3rd party
+			from PIL import Image  # type: ignore
+		except ImportError:  # pragma: no cover
+			return None
+
+		if not isinstance(self.fig.canvas, FigureCanvasAgg):
+			return None
+
+		rc = matplotlib.rcParams
+		if dpi is None:
+			dpi = rc["savefig.dpi"]
+		if dpi != "figure" and dpi != self.fig.dpi:
+			return None
+		if rc["savefig.bbox"] == "tight" or rc["savefig.transparent"]:
+			return None
+
+		for key, get_colour in (("facecolor", self.fig.get_facecolor), ("edgecolor", self.fig.get_edgecolor)):
+			colour = rc[f"savefig.{key}"]
+			if colour != "auto" and to_rgba(colour) != to_rgba(get_colour()):
+				return None
+
+		self.fig.canvas.draw()
+		return Image.fromarray(numpy.asarray(self.fig.canvas.buffer_rgba()))
+
 	def show_chart(self):
 		"""
 		Show the chart on screen.
@@ -317,6 +451,9 @@ Please call a plotting function before calling 'do_plotting()'""",
 		:author: Dominic Davis-Foster
 		"""
 
+		# 3rd party
+		import matplotlib.pyplot as plt  # type: ignore
+
 		# matplotlib.use("TkAgg")
 
 		self.fig.show()
@@ -324,7 +461,7 @@ Please call a plotting function before calling 'do_plotting()'""",
 		plt.close()
 
 
-def plot_ic(ax: matplotlib.axes.Axes, ic: IonChromatogram, minutes: bool = False, **kwargs) -> List[Line2D]:
+def plot_ic(ax: "Axes", ic: IonChromatogram, minutes: bool = False, **kwargs) -> List["Line2D"]:
 	"""
 	Plots an Ion Chromatogram.
 
@@ -349,40 +486,96 @@ def plot_ic(ax: matplotlib.axes.Axes, ic: IonChromatogram, minutes: bool = False
 	if not isinstance(ic, IonChromatogram):
 		raise TypeError("'ic' must be an IonChromatogram")
 
-	time_list = ic.time_list
+	time_array = numpy.asarray(ic.time_list)
 	if minutes:
-		time_list = [time / 60 for time in time_list]
+		time_array = time_array / 60
 
-	plot = ax.plot(time_list, ic.intensity_array, **kwargs)
+	plot = ax.plot(time_array, ic.intensity_array, **kwargs)
 
 	# Set axis ranges
-	ax.set_xlim(min(time_list), max(time_list))
+	ax.set_xlim(time_array.min(), time_array.max())
 	ax.set_ylim(bottom=0)
 
 	return plot
 
 
-def plot_mass_spec(ax: Axes, mass_spec: MassSpectrum, **kwargs) -> BarContainer:
+def plot_ics(ax: "Axes", ics: Sequence[IonChromatogram], minutes: bool = False, **kwargs) -> "LineCollection":
+	"""
+	Plots several Ion Chromatograms as a single collection of lines.
+
+	Drawing one :class:`~matplotlib.collections.LineCollection` is much faster than
+	drawing a separate line for each Ion Chromatogram when there are many of them.
+
+	:param ax: The axes to plot the IonChromatograms on
+	:param ics: Ion Chromatograms to plot
+	:param minutes: Whether the x-axis should be plotted in minutes. Default False (plotted in seconds)
+
+	:Other Parameters: :class:`matplotlib.collections.LineCollection` properties.
+		Used to specify properties like a label (for auto legends),
+		colors, linewidths, antialiasing. By default each Ion Chromatogram
+		takes the next colour from the axes' colour cycle.
+
+		Example::
+
+		>>> plot_ics(ax, [im.get_ic_at_index(5), im.get_ic_at_index(6)], linewidths=2)
+
+		See https://matplotlib.org/3.1.1/api/collections_api.html#matplotlib.collections.LineCollection
+		for the list of possible kwargs
+
+	:return: The collection containing one line per Ion Chromatogram.
+	"""
+
+	# 3rd party
+	import matplotlib  # type: ignore
+	from matplotlib.collections import LineCollection  # type: ignore
+
+	if not ics or not all(isinstance(ic, IonChromatogram) for ic in ics):
+		raise TypeError("'ics' must be a non-empty sequence of IonChromatograms")
+
+	segments = []
+	for ic in ics:
+		time_array = numpy.asarray(ic.time_list)
+		if minutes:
+			time_array = time_array / 60
+		segments.append(numpy.column_stack((time_array, ic.intensity_array)))
+
+	if "colors" not in kwargs and "color" not in kwargs:
+		colour_cycle = itertools.cycle(matplotlib.rcParams["axes.prop_cycle"].by_key()["color"])
+		kwargs["colors"] = [colour for _, colour in zip(ics, colour_cycle)]
+
+	plot = LineCollection(segments, **kwargs)
+	ax.add_collection(plot)
+
+	# Set axis ranges
+	all_times = numpy.concatenate([segment[:, 0] for segment in segments])
+	ax.set_xlim(all_times.min(), all_times.max())
+	ax.autoscale_view(scalex=False)
+	ax.set_ylim(bottom=0)
+
+	return plot
+
+
+def plot_mass_spec(ax: "Axes", mass_spec: MassSpectrum, **kwargs) -> "LineCollection":
 	"""
 	Plots a Mass Spectrum.
 
 	:param ax: The axes to plot the MassSpectrum on
 	:param mass_spec: The mass spectrum to plot
 
-	:Other Parameters: :class:`matplotlib.lines.Line2D` properties.
+	:Other Parameters: :class:`matplotlib.collections.LineCollection` properties.
 		Used to specify properties like a line label (for auto legends),
-		linewidth, antialiasing, marker face color.
+		alpha, antialiasing, color. ``width`` sets the width of the
+		stems and defaults to ``0.5``.
 
 		Example::
 
-		>>> plot_mass_spec(im.get_ms_at_index(5), linewidth=2)
+		>>> plot_mass_spec(im.get_ms_at_index(5), width=2)
 		>>>	ax.set_title(f"Mass spec for peak at time {im.get_time_at_index(5):5.2f}")
 
-		See https://matplotlib.org/3.1.1/api/_as_gen/matplotlib.lines.Line2D.html
+		See https://matplotlib.org/3.1.1/api/collections_api.html#matplotlib.collections.LineCollection
 		for the list of possible kwargs
 
-	:return: Container with all the bars and optionally errorbars.
-	:rtype: :class:`matplotlib.container.BarContainer`
+	:return: A single collection containing one stem per m/z channel.
 	"""
 
 	if not isinstance(mass_spec, MassSpectrum):
@@ -391,22 +584,15 @@ def plot_mass_spec(ax: Axes, mass_spec: MassSpectrum, **kwargs) -> BarContainer:
 	mass_list = mass_spec.mass_list
 	intensity_list = mass_spec.mass_spec
 
-	if "width" not in kwargs:
-		kwargs["width"] = 0.5
+	width = kwargs.pop("width", 0.5)
 
 	# to set x axis range find minimum and maximum m/z channels
-	min_mz = mass_list[0]
-	max_mz = mass_list[-1]
+	mass_array = numpy.asarray(mass_list)
+	min_mz = mass_array.min()
+	max_mz = mass_array.max()
 
-	for idx, mass in enumerate(mass_list):
-		if mass_list[idx] > max_mz:
-			max_mz = mass_list[idx]
-
-	for idx, mass in enumerate(mass_list):
-		if mass_list[idx] < min_mz:
-			min_mz = mass_list[idx]
-
-	plot = ax.bar(mass_list, intensity_list, **kwargs)
+	# A single LineCollection is much cheaper to build and draw than one bar per channel
+	plot = ax.vlines(mass_list, 0, intensity_list, linewidths=width, **kwargs)
 
 	# Set axis ranges
 	ax.set_xlim(min_mz - 1, max_mz + 1)
@@ -416,12 +602,12 @@ def plot_mass_spec(ax: Axes, mass_spec: MassSpectrum, **kwargs) -> BarContainer:
 
 
 def plot_head2tail(
-		ax: Axes,
+		ax: "Axes",
 		top_mass_spec: MassSpectrum,
 		bottom_mass_spec: MassSpectrum,
 		top_spec_kwargs: Optional[Dict] = None,
 		bottom_spec_kwargs: Optional[Dict] = None,
-		) -> Tuple[BarContainer, BarContainer]:
+		) -> Tuple["LineCollection", "LineCollection"]:
 	"""
 	Plots two mass spectra head to tail.
 
@@ -437,13 +623,12 @@ def plot_head2tail(
 	:no-default bottom_spec_kwargs:
 
 	`top_spec_kwargs` and `bottom_spec_kwargs` are used to specify properties like a line label
-		(for auto legends), linewidth, antialiasing, marker face color.
+		(for auto legends), width, antialiasing, color.
 
-		See https://matplotlib.org/3.1.1/api/_as_gen/matplotlib.lines.Line2D.html
+		See https://matplotlib.org/3.1.1/api/collections_api.html#matplotlib.collections.LineCollection
 		for the list of possible kwargs
 
-	:return: A tuple of container with all the bars and optionally errorbars for the top and bottom spectra.
-	:rtype: tuple of :class:`matplotlib.container.BarContainer`
+	:return: A tuple of the collections of stems for the top and bottom spectra.
 	"""
 
 	if not isinstance(top_mass_spec, MassSpectrum):
@@ -479,8 +664,8 @@ def plot_head2tail(
 
 	# Set ylim to 1.1 times max/min values
 	ax.set_ylim(
-			bottom=min(bottom_mass_spec.intensity_list) * 1.1,
-			top=max(top_mass_spec.intensity_list) * 1.1,
+			bottom=bottom_mass_spec.mass_spec.min() * 1.1,
+			top=top_mass_spec.mass_spec.max() * 1.1,
 			)
 
 	# ax.spines['bottom'].set_position('zero')
@@ -488,40 +673,66 @@ def plot_head2tail(
 	return top_plot, bottom_plot
 
 
-def plot_peaks(ax: Axes, peak_list: List[Peak.Peak], label: str = "Peaks", style: str = 'o') -> List[Line2D]:
+def plot_peaks(
+		ax: "Axes",
+		peak_list: List[Peak.Peak],
+		label: str = "Peaks",
+		style: str = 'o',
+		) -> List[Union["Line2D", "LineCollection"]]:
 	"""
 	Plots the locations of peaks as found by PyMassSpec.
 
 	:param ax: The axes to plot the peaks on
 	:param peak_list: List of peaks to plot
 	:param label: label for plot legend.
-	:param style: The marker style. See `https://matplotlib.org/3.1.1/api/markers_api.html` for a complete list
+	:param style: The marker style. See `https://matplotlib.org/3.1.1/api/markers_api.html` for a complete list.
+		If ``style`` contains ``'line'`` the peaks are instead marked with vertical lines.
 
-	:return: A list of Line2D objects representing the plotted data.
+	:return: A list of Line2D objects representing the plotted data,
+		or a list containing a single LineCollection of the vertical lines.
+
+	The check that every element of ``peak_list`` is a :class:`~pyms.Peak.Peak`
+	is skipped when Python is run with optimizations enabled (``python -O``).
 	"""
 
-	if not is_peak_list(peak_list):
+	if __debug__ and not is_peak_list(peak_list):
 		raise TypeError("'peak_list' must be a list of Peak objects")
 
-	time_list = []
-	height_list = []
-
 	if "line" in style.lower():
-		lines = []
-		for peak in peak_list:
-			lines.append(ax.axvline(x=peak.rt, color="lightgrey", alpha=0.8, linewidth=0.3))
+		# 3rd party
+		from matplotlib.collections import LineCollection  # type: ignore
+
+		rt_array = numpy.fromiter((peak.rt for peak in peak_list), dtype=numpy.float64, count=len(peak_list))
+
+		# One collection of lines spanning the full height of the axes, rather than an axvline per peak
+		bottoms = numpy.column_stack((rt_array, numpy.zeros_like(rt_array)))
+		tops = numpy.column_stack((rt_array, numpy.ones_like(rt_array)))
+		segments = numpy.stack((bottoms, tops), axis=1)
+		lines = LineCollection(
+				segments,
+				colors="lightgrey",
+				alpha=0.8,
+				linewidths=0.3,
+				transform=ax.get_xaxis_transform(),
+				)
+		ax.add_collection(lines, autolim=False)
 
-		return lines
+		if rt_array.size:
+			ax.update_datalim([(rt_array.min(), 0), (rt_array.max(), 0)], updatey=False)
+			ax.autoscale_view(scaley=False)
+
+		return [lines]
 
 	else:
-		for peak in peak_list:
-			time_list.append(peak.rt)
-			height_list.append(sum(peak.mass_spectrum.intensity_list))
-			# height_list.append(peak.height)
-			# print(peak.height - sum(peak.mass_spectrum.intensity_list))
-			# print(sum(peak.mass_spectrum.intensity_list))
+		n_peaks = len(peak_list)
+		time_array = numpy.fromiter((peak.rt for peak in peak_list), dtype=numpy.float64, count=n_peaks)
+		height_array = numpy.fromiter(
+				(peak.mass_spectrum.mass_spec.sum() for peak in peak_list),
+				dtype=numpy.float64,
+				count=n_peaks,
+				)
 
-		return ax.plot(time_list, height_list, style, label=label)
+		return ax.plot(time_array, height_array, style, label=label)
 
 
 # TODO: Change order of arguments and use plt.gca() a la pyplot
@@ -534,6 +745,9 @@ class ClickEventHandler:
 	"""  # noqa: D400
 
 	def __init__(self, peak_list, fig=None, ax=None, tolerance=0.005, n_intensities=5):
+		# 3rd party
+		import matplotlib.pyplot as plt  # type: ignore
+
 		if fig is None:
 			self.fig = plt.gcf()
 		else:
@@ -545,10 +759,18 @@ class ClickEventHandler:
 			self.ax = ax
 
 		self.peak_list = peak_list
+		self._sorted_rts, self._rt_order = _sort_peak_rts(peak_list)
+
+		# Mass spectra of peaks that have been clicked on, by index in the peak list.
+		# Peak.mass_spectrum returns a new copy each time, so it is only fetched once per peak.
+		self._mass_spectra: Dict[int, MassSpectrum] = {}
 
 		self.ms_fig = None
 		self.ms_ax = None
 
+		# The spectrum currently shown in the mass spectrum pop-up
+		self._ms_plot: Optional["LineCollection"] = None
+
 		self._min = 1 - tolerance
 		self._max = 1 + tolerance
 		self.n_intensities = n_intensities
@@ -568,38 +790,61 @@ class ClickEventHandler:
 		:param event: a mouse click by the user
 		"""
 
-		for peak in self.peak_list:
-			# if event.xdata > 0.9999*peak.rt and event.xdata < 1.0001*peak.rt:
-			if self._min * peak.rt < event.xdata < self._max * peak.rt:
-				intensity_list = peak.mass_spectrum.mass_spec
-				mass_list = peak.mass_spectrum.mass_list
+		peak_idx = _find_peak_index(self._sorted_rts, self._rt_order, event.xdata, self._min, self._max)
 
-				largest = self.get_n_largest(intensity_list)
+		if peak_idx is None:
+			# if the selected point is not close enough to peak
+			print("No Peak at this point")
+			return
 
-				print(f"RT: {peak.rt}")
-				print("Mass\t Intensity")
-				for i in range(self.n_intensities):
-					print(f"{mass_list[largest[i]]}\t {intensity_list[largest[i]]}")
+		peak = self.peak_list[peak_idx]
+		if peak_idx not in self._mass_spectra:
+			self._mass_spectra[peak_idx] = peak.mass_spectrum
+		mass_spectrum = self._mass_spectra[peak_idx]
+		intensity_list = numpy.asarray(mass_spectrum.mass_spec)
+		mass_list = numpy.asarray(mass_spectrum.mass_list)
 
-				# Check if right mouse button pressed, if so plot mass spectrum
-				# Also check that a peak was selected, not just whitespace
-				if event.button == 3 and len(intensity_list) != 0:
-					# from pyms.Display import plot_mass_spec
+		largest = self.get_n_largest(intensity_list)
 
-					if self.ms_fig is None:
-						self.ms_fig, self.ms_ax = plt.subplots(1, 1)
-					else:
-						self.ms_ax.clear()  # type: ignore
+		# Index all the selected channels at once and print in a single call
+		lines = "\n".join(
+				f"{mass}\t {intensity}" for mass, intensity in zip(mass_list[largest], intensity_list[largest])
+				)
+		print(f"RT: {peak.rt}\nMass\t Intensity\n{lines}")
 
-					plot_mass_spec(self.ms_ax, peak.mass_spectrum)
-					self.ms_ax.set_title(f"Mass Spectrum at RT {peak.rt}")  # type: ignore
-					self.ms_fig.show()
-				# TODO: Add multiple MS to same plot window and add option to close one of them
-				# TODO: Allow more interaction with MS, e.g. adjusting mass range?
-				return
+		# Check if right mouse button pressed, if so plot mass spectrum
+		# Also check that a peak was selected, not just whitespace
+		if event.button == 3 and len(intensity_list) != 0:
+			self._show_mass_spec(mass_spectrum, peak.rt)
+		# TODO: Add multiple MS to same plot window and add option to close one of them
+		# TODO: Allow more interaction with MS, e.g. adjusting mass range?
+
+	def _show_mass_spec(self, mass_spectrum: MassSpectrum, rt: float):
+		"""
+		Show the mass spectrum in the pop-up figure.
 
-		# if the selected point is not close enough to peak
-		print("No Peak at this point")
+		The pop-up figure is created on the first right click and reused afterwards,
+		with the previous spectrum replaced by the new one.
+
+		:param mass_spectrum: The mass spectrum to show.
+		:param rt: The retention time of the peak, for the title.
+		"""
+
+		# 3rd party
+		import matplotlib.pyplot as plt  # type: ignore
+
+		if self.ms_fig is None:
+			self.ms_fig, self.ms_ax = plt.subplots(1, 1)
+		elif self._ms_plot is not None:
+			self._ms_plot.remove()
+			# Rescale to the new spectrum only
+			self.ms_ax.ignore_existing_data_limits = True  # type: ignore
+			self.ms_ax.set_autoscale_on(True)  # type: ignore
+
+		self._ms_plot = plot_mass_spec(self.ms_ax, mass_spectrum)
+		self.ms_ax.set_title(f"Mass Spectrum at RT {rt}")  # type: ignore
+		self.ms_fig.show()
+		self.ms_fig.canvas.draw_idle()
 
 	def get_n_largest(self, intensity_list: List[float]) -> List[int]:
 		"""
@@ -610,21 +855,82 @@ class ClickEventHandler:
 		:return: Indices of largest ``n`` ion intensities
 		"""
 
-		largest = [0] * self.n_intensities
+		return _top_n_indices(intensity_list, self.n_intensities)
+
+
+def _sort_peak_rts(peak_list: Sequence[Peak.Peak]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+	"""
+	Returns the retention times of the peaks in ascending order,
+	and the indices into ``peak_list`` that sort them.
+
+	:param peak_list: List of peaks
+	"""  # noqa: D400
+
+	rt_array = numpy.fromiter((peak.rt for peak in peak_list), dtype=numpy.float64, count=len(peak_list))
+	rt_order = numpy.argsort(rt_array, kind="stable")
+
+	return rt_array[rt_order], rt_order
+
+
+def _find_peak_index(
+		sorted_rts: numpy.ndarray,
+		rt_order: numpy.ndarray,
+		xdata: Optional[float],
+		min_factor: float,
+		max_factor: float,
+		) -> Optional[int]:
+	"""
+	Returns the index of the first peak for which ``min_factor * rt < xdata < max_factor * rt``,
+	using a binary search of the sorted retention times rather than checking every peak.
+
+	:param sorted_rts: The retention times of the peaks in ascending order, from :func:`~._sort_peak_rts`.
+	:param rt_order: The indices of the peaks that sort the retention times, from :func:`~._sort_peak_rts`.
+	:param xdata: The retention time clicked on. :py:obj:`None` if the click was outside the axes.
+	:param min_factor:
+	:param max_factor:
+
+	:return: The index of the peak in the original peak list, or :py:obj:`None` if no peak is close enough.
+	"""  # noqa: D400
+
+	if xdata is None or not sorted_rts.size:
+		return None
+
+	lower, upper = sorted(((xdata / max_factor), (xdata / min_factor)))
+
+	# Widen by one either side to allow for rounding, then apply the exact test
+	start = max(int(numpy.searchsorted(sorted_rts, lower, side="left")) - 1, 0)
+	stop = int(numpy.searchsorted(sorted_rts, upper, side="right")) + 1
+
+	candidates = [
+			int(idx)
+			for idx, rt in zip(rt_order[start:stop], sorted_rts[start:stop])
+			if min_factor * rt < xdata < max_factor * rt
+			]
+
+	if candidates:
+		return min(candidates)
+
+	return None
+
+
+def _top_n_indices(intensity_list: Union[Sequence[float], numpy.ndarray], n: int) -> List[int]:
+	"""
+	Returns the indices of the ``n`` largest intensities, in descending order of intensity.
+
+	:param intensity_list: List of Ion intensities
+	:param n: The number of indices to return. Fewer are returned if
+		``intensity_list`` has fewer than ``n`` elements.
+	"""
 
-		# Find out largest value
-		for idx, intensity in enumerate(intensity_list):
-			if intensity > intensity_list[largest[0]]:
-				largest[0] = idx
+	intensity_array = numpy.asarray(intensity_list)
+	n = min(n, intensity_array.size)
 
-		# Now find next four largest values
-		for j in list(range(1, self.n_intensities)):
-			for idx, intensity in enumerate(intensity_list):
-				# if intensity_list[i] > intensity_list[largest[j]] and intensity_list[i] < intensity_list[largest[j-1]]:
-				if intensity_list[largest[j]] < intensity < intensity_list[largest[j - 1]]:
-					largest[j] = idx
+	if n <= 0:
+		return []
 
-		return largest
+	# Select the n largest in linear time, then sort just those
+	largest = numpy.argpartition(intensity_array, -n)[-n:]
+	return largest[numpy.argsort(-intensity_array[largest], kind="stable")].tolist()
 
 
 def invert_mass_spec(mass_spec: MassSpectrum, inplace: bool = False) -> MassSpectrum:
@@ -638,7 +944,7 @@ def invert_mass_spec(mass_spec: MassSpectrum, inplace: bool = False) -> MassSpec
 	:return: The normalized mass spectrum
 	"""
 
-	inverted_intensity_list = [-x for x in mass_spec.intensity_list]
+	inverted_intensity_list = numpy.negative(numpy.asarray(mass_spec.mass_spec, dtype=numpy.float64))
 
 	if inplace:
 		mass_spec.intensity_list = inverted_intensity_list
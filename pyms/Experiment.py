@@ -24,10 +24,11 @@ Models a GC-MS experiment, represented by a list of signal peaks.
 ################################################################################
 
 # stdlib
-import copy
 import pathlib
 import os
-from typing import List, Sequence, Union
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 # this package
 from pyms.Base import pymsBaseClass
@@ -50,6 +51,8 @@ class Experiment(pymsBaseClass):
     :author: Vladimir Likic, Andrew Isaac,  Dominic Davis-Foster (type assertions, properties and pathlib support)
     """
 
+    __slots__ = ("_expr_code", "_peak_list")
+
     def __init__(self, expr_code: str, peak_list: Sequence[Peak]):
         if not isinstance(expr_code, str):
             raise TypeError("'expr_code' must be a string")
@@ -57,8 +60,27 @@ class Experiment(pymsBaseClass):
         if not is_peak_list(peak_list):
             raise TypeError("'peak_list' must be a list of Peak objects")
 
+        # Experiments in a large cohort often share codes; keep one copy of each.
+        self._expr_code = sys.intern(expr_code)
+
+        # Only copy the peaks into a new list if they aren't in one already.
+        self._peak_list = peak_list if type(peak_list) is list else list(peak_list)
+
+    @classmethod
+    def _from_trusted(cls, expr_code: str, peak_list: List[Peak]) -> "Experiment":
+        """
+        Construct an Experiment from values which are already known to be valid,
+        skipping the type checks in :meth:`~.Experiment.__init__`.
+
+        :param expr_code: A unique identifier for the experiment.
+        :param peak_list: A list of :class:`~pyms.Peak.Peak` objects. This is used directly, not copied.
+        """  # noqa: D400
+
+        self = cls.__new__(cls)
         self._expr_code = expr_code
-        self._peak_list = list(peak_list)
+        self._peak_list = peak_list
+
+        return self
 
     def __eq__(self, other) -> bool:
         """
@@ -68,7 +90,8 @@ class Experiment(pymsBaseClass):
         """
 
         if isinstance(other, self.__class__):
-            return self.peak_list == other.peak_list and self.expr_code == other.expr_code
+            # Compare the codes first; list equality then rejects mismatched lengths before comparing peaks.
+            return self._expr_code == other._expr_code and self._peak_list == other._peak_list
 
         return NotImplemented
 
@@ -84,14 +107,36 @@ class Experiment(pymsBaseClass):
         Returns a new Experiment object containing a copy of the data in this object.
         """
 
-        return Experiment(copy.copy(self._expr_code), copy.copy(self.peak_list))
+        # The peaks were validated when this Experiment was created.
+        return Experiment._from_trusted(self._expr_code, self._peak_list[:])
 
-    def __deepcopy__(self, memodict={}) -> "Experiment":
+    def __deepcopy__(self, memodict: Optional[Dict[int, Any]] = None) -> "Experiment":
         """
         Returns a new Experiment object containing a copy of the data in this object.
+
+        The peaks themselves are shared with this object, as with :meth:`~.Experiment.__copy__`.
         """
 
-        return self.__copy__()
+        new_expr = self.__copy__()
+
+        # Register the copy so other references to this Experiment in the
+        # object being deep copied resolve to the same new object.
+        if memodict is not None:
+            memodict[id(self)] = new_expr
+
+        return new_expr
+
+    def __getstate__(self) -> Tuple[str, List[Peak]]:
+        return self._expr_code, self._peak_list
+
+    def __setstate__(self, state: Union[Tuple[str, List[Peak]], Dict[str, Any]]):
+        # The peaks were validated before the Experiment was pickled.
+        if isinstance(state, dict):
+            # Experiments pickled by earlier versions
+            state = state["_expr_code"], state["_peak_list"]
+
+        expr_code, self._peak_list = state
+        self._expr_code = sys.intern(expr_code)
 
     @property
     def expr_code(self) -> str:
@@ -140,18 +185,13 @@ def read_expr_list(file_name: PathLike) -> List[Experiment]:
     file_name = prepare_filepath(file_name, mkdirs=False)
 
     with file_name.open(encoding="UTF-8") as fp:
-        exprfiles = fp.readlines()
-
-    expr_list = []
-
-    for exprfile in exprfiles:
-
-        exprfile = exprfile.strip()
-        expr = load_expr(exprfile)
-
-        expr_list.append(expr)
+        # One file per line; blank lines (e.g. a trailing newline) are skipped.
+        exprfiles = [exprfile for exprfile in map(str.strip, fp) if exprfile]
 
-    return expr_list
+    # The files are independent and mostly I/O bound, so load them concurrently.
+    # ``map`` returns the experiments in the order they are listed in the file.
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(exprfiles)))) as executor:
+        return list(executor.map(load_expr, exprfiles))
 
 
 def load_expr(file_name: PathLike) -> Experiment:
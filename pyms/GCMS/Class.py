@@ -24,10 +24,8 @@ Class to model GC-MS data.
 ################################################################################
 
 # stdlib
-import copy
 import pathlib
 import os
-from statistics import mean, median, stdev
 from typing import List, Optional, Sequence, TypeVar, Union, cast
 
 # 3rd party
@@ -49,6 +47,9 @@ MassSpectrum = MassSpectrum  # For legacy imports. Stops PyCharm complaining TOD
 IntStr = TypeVar("IntStr", int, str)
 PathLike = Union[str, pathlib.Path, os.PathLike]
 
+_format_4f = "{:.4f}".format
+_write_buffer_size = 1 << 20
+
 
 class GCMS_data(pymsBaseClass, TimeListMixin, MaxMinMassMixin, GetIndexTimeMixin):
     """
@@ -64,17 +65,21 @@ class GCMS_data(pymsBaseClass, TimeListMixin, MaxMinMassMixin, GetIndexTimeMixin
     """
 
     def __init__(self, time_list: Sequence[float], scan_list: Sequence[Scan]):
-        if not is_sequence_of(time_list, _number_types):
+        # A numeric array can be checked by its dtype rather than element by element.
+        if isinstance(time_list, numpy.ndarray) and numpy.issubdtype(time_list.dtype, numpy.number):
+            pass
+        elif not is_sequence_of(time_list, _number_types):
             raise TypeError("'time_list' must be a Sequence of numbers")
 
         if not is_sequence_of(scan_list, Scan):
             raise TypeError("'scan_list' must be a Sequence of Scan objects")
 
-        self._time_list = numpy.array(time_list)
+        self._time_list = numpy.array(time_list, dtype=numpy.float64)
         self._scan_list = numpy.array(scan_list)
+        self._scan_lengths = numpy.fromiter(map(len, self._scan_list), dtype=numpy.intp, count=len(self._scan_list))
         self._set_time()
         self._set_min_max_mass()
-        self._calc_tic()
+        self._tic: Optional[IonChromatogram] = None
 
     def __eq__(self, other) -> bool:
         """
@@ -84,7 +89,11 @@ class GCMS_data(pymsBaseClass, TimeListMixin, MaxMinMassMixin, GetIndexTimeMixin
         """
 
         if isinstance(other, self.__class__):
-            return self.scan_list == other.scan_list and self.time_list == other.time_list
+            # array_equal rejects a different number of scans before comparing any values.
+            return (
+                numpy.array_equal(self._time_array, other._time_array)
+                and all(scan == other_scan for scan, other_scan in zip(self._scan_list, other._scan_list))
+            )
 
         return NotImplemented
 
@@ -110,12 +119,19 @@ class GCMS_data(pymsBaseClass, TimeListMixin, MaxMinMassMixin, GetIndexTimeMixin
         :authors: Qiao Wang, Andrew Isaac, Vladimir Likic
         """
 
-        intensities = []
-        for scan in self._scan_list:
-            intensities.append(sum(scan.intensity_list))
-        ia = numpy.array(intensities)
-        rt = copy.deepcopy(self._time_list)
-        tic = IonChromatogram(ia, rt)
+        lengths = self._scan_lengths
+
+        # Sum each scan in a single reduction over the concatenated intensities.
+        # Empty scans are skipped, as ``reduceat`` can't express an empty segment.
+        ia = numpy.zeros(len(lengths))
+        not_empty = lengths > 0
+        if not_empty.any():
+            starts = numpy.cumsum(lengths) - lengths
+            intensities = numpy.concatenate([scan.intensity_list for scan in self._scan_list])
+            ia[not_empty] = numpy.add.reduceat(intensities, starts[not_empty])
+
+        # IonChromatogram takes its own copy of the times.
+        tic = IonChromatogram(ia, self._time_array)
 
         self._tic = tic
 
@@ -126,26 +142,21 @@ class GCMS_data(pymsBaseClass, TimeListMixin, MaxMinMassMixin, GetIndexTimeMixin
         :author: Vladimir Likic
         """
 
-        # calculate the time step, its spread, and along the way
-        # check that retention times are increasing
-        time_diff_list = []
+        time_array = self._time_list
+        time_diffs = numpy.diff(time_array)
 
-        for index, t1 in enumerate(self._time_list):
-            if index == len(self._time_list) - 1:
-                break
-            t2 = self._time_list[index + 1]
-            if not t2 > t1:
-                raise ValueError("Retention times are not in ascending order!")
-            time_diff = t2 - t1
-            time_diff_list.append(time_diff)
+        # The time step's standard deviation needs at least two differences
+        if len(time_diffs) < 2:
+            raise ValueError("At least three retention times are required")
 
-        time_step = mean(time_diff_list)
-        time_step_std = stdev(time_diff_list)
+        if not (time_diffs > 0).all():
+            raise ValueError("Retention times are not in ascending order!")
 
-        self._time_step = time_step
-        self._time_step_std = time_step_std
-        self._min_rt = min(self._time_list)
-        self._max_rt = max(self._time_list)
+        self._time_step = time_diffs.mean()
+        self._time_step_std = time_diffs.std(ddof=1)
+        self._min_rt = time_array[0]
+        self._max_rt = time_array[-1]
+        self._time_array = time_array
 
     def _set_min_max_mass(self) -> None:
         """
@@ -154,22 +165,16 @@ class GCMS_data(pymsBaseClass, TimeListMixin, MaxMinMassMixin, GetIndexTimeMixin
         :authors: Qiao Wang, Andrew Isaac, Vladimir Likic
         """
 
-        mini = self._scan_list[0].min_mass
-        maxi = self._scan_list[0].max_mass
-        for scan in self._scan_list:
-
-            tmp_mini = scan.min_mass
-            if tmp_mini is not None and mini is not None:
-                if tmp_mini < mini:
-                    mini = tmp_mini
+        # Each scan already knows its own mass range; empty scans have none.
+        scans = self._scan_list[self._scan_lengths > 0]
+        mass_ranges = numpy.array([(scan.min_mass, scan.max_mass) for scan in scans])
 
-            tmp_maxi = scan.max_mass
-            if tmp_maxi is not None and maxi is not None:
-                if tmp_maxi > maxi:
-                    maxi = tmp_maxi
-
-        self._min_mass = mini
-        self._max_mass = maxi
+        if len(mass_ranges):
+            self._min_mass = mass_ranges[:, 0].min()
+            self._max_mass = mass_ranges[:, 1].max()
+        else:
+            self._min_mass = None
+            self._max_mass = None
 
     def info(self, print_scan_n: bool = False) -> None:
         """
@@ -188,14 +193,11 @@ class GCMS_data(pymsBaseClass, TimeListMixin, MaxMinMassMixin, GetIndexTimeMixin
         print(f" Maximum m/z measured: {self._max_mass:.3f}")
 
         # calculate median number of m/z values measured per scan
-        n_list = []
-        for scan in self._scan_list:
-            n = len(scan)
-            n_list.append(n)
-            if print_scan_n:
-                print(n)
-        mz_mean = mean(n_list)
-        mz_median = median(n_list)
+        n_list = self._scan_lengths
+        if print_scan_n and len(n_list):
+            print('\n'.join(map(str, n_list.tolist())))
+        mz_mean = n_list.mean()
+        mz_median = numpy.median(n_list)
         print(f" Mean number of m/z values per scan: {mz_mean:.0f}")
         print(f" Median number of m/z values per scan: {mz_median:.0f}")
 
@@ -204,28 +206,36 @@ class GCMS_data(pymsBaseClass, TimeListMixin, MaxMinMassMixin, GetIndexTimeMixin
         """
         Return a list of the scan objects.
 
+        The list is a new list, but the scans in it are shared with this object
+        and should be treated as read-only.
+
         :authors: Qiao Wang, Andrew Isaac, Vladimir Likic
         """
 
-        return copy.deepcopy(self._scan_list)
+        return list(self._scan_list)
 
     @property
-    def time_list(self) -> List[float]:
+    def time_list(self) -> numpy.ndarray:
         """
-        Return a copy of the time list.
+        Return a copy of the retention times, as an array.
         """
 
-        return self._time_list[:]
+        return self._time_list.copy()
 
     @property
     def tic(self) -> IonChromatogram:
         """
         Returns the total ion chromatogram.
 
+        The TIC is calculated the first time it is requested.
+
         :author: Andrew Isaac
         """
 
-        return self._tic
+        if self._tic is None:
+            self._calc_tic()
+
+        return cast(IonChromatogram, self._tic)
 
     @property
     def min_rt(self) -> float:
@@ -326,21 +336,27 @@ class GCMS_data(pymsBaseClass, TimeListMixin, MaxMinMassMixin, GetIndexTimeMixin
 
         print(f"Trimming data to between {first_scan + 1:d} and {last_scan + 1:d} scans")
 
-        scan_list_new = []
-        time_list_new = []
-        for ii in range(len(self._scan_list)):
-            if first_scan <= ii <= last_scan:
-                scan = self._scan_list[ii]
-                time = self._time_list[ii]
-                scan_list_new.append(scan)
-                time_list_new.append(time)
+        self._trim_by_index(first_scan, last_scan)
+
+    def _trim_by_index(self, first_scan: int, last_scan: int) -> None:
+        """
+        Keep only the scans from ``first_scan`` to ``last_scan`` (inclusive, zero-based).
+
+        The indices are not checked; :meth:`~.GCMS_data.trim` validates them.
+
+        :param first_scan: Index of the first scan to keep.
+        :param last_scan: Index of the last scan to keep.
+        """
+
+        # Copy the selection so the trimmed-off scans can be freed.
+        self._scan_list = self._scan_list[first_scan:last_scan + 1].copy()
+        self._time_list = self._time_list[first_scan:last_scan + 1].copy()
+        self._scan_lengths = self._scan_lengths[first_scan:last_scan + 1].copy()
 
         # update info
-        self._scan_list = scan_list_new
-        self._time_list = time_list_new
         self._set_time()
         self._set_min_max_mass()
-        self._calc_tic()
+        self._tic = None
 
     def write(self, file_root: PathLike):
         """
@@ -368,22 +384,15 @@ class GCMS_data(pymsBaseClass, TimeListMixin, MaxMinMassMixin, GetIndexTimeMixin
         print(f" -> Writing intensities to '{file_name1}'")
         print(f" -> Writing m/z values to '{file_name2}'")
 
-        with open(file_name1, 'w', encoding="UTF-8") as fp1, open(file_name2, 'w', encoding="UTF-8") as fp2:
+        with open(file_name1, 'w', encoding="UTF-8", buffering=_write_buffer_size) as fp1, \
+                open(file_name2, 'w', encoding="UTF-8", buffering=_write_buffer_size) as fp2:
 
             for scan in self._scan_list:
-
-                for index, intensity in enumerate(scan.intensity_list):
-                    if index == 0:
-                        fp1.write(f"{intensity:.4f}")
-                    else:
-                        fp1.write(f",{intensity:.4f}")
+                # ``tolist`` gives Python numbers, which format faster.
+                fp1.write(','.join(map(_format_4f, scan.intensity_list.tolist())))
                 fp1.write('\n')
 
-                for index, mass in enumerate(scan.mass_list):
-                    if index == 0:
-                        fp2.write(f"{mass:.4f}")
-                    else:
-                        fp2.write(f",{mass:.4f}")
+                fp2.write(','.join(map(_format_4f, scan.mass_list.tolist())))
                 fp2.write('\n')
 
     def write_intensities_stream(self, file_name: PathLike):
@@ -407,9 +416,9 @@ class GCMS_data(pymsBaseClass, TimeListMixin, MaxMinMassMixin, GetIndexTimeMixin
 
         print(" -> Writing scans to a file")
 
-        with file_name.open('w', encoding="UTF-8") as fp:
+        with file_name.open('w', encoding="UTF-8", buffering=_write_buffer_size) as fp:
 
             for scan in self._scan_list:
-                intensities = scan.intensity_list
-                for i in intensities:
-                    fp.write(f"{i:8.4f}\n")
+                # A single %-format of the whole scan is faster than formatting each value separately.
+                intensities = tuple(scan.intensity_list.tolist())
+                fp.write(("%8.4f\n" * len(intensities)) % intensities)
@@ -24,9 +24,11 @@ Provides conversion and information functions for GC-MS data objects.
 ################################################################################
 
 # stdlib
-import math
 import sys
-from typing import Union
+from typing import List, Union
+
+# 3rd party
+import numpy
 
 # this package
 from pyms import IonChromatogram
@@ -75,15 +77,15 @@ def diff(data1: GCMS_data, data2: GCMS_data):
         # some unexpected problem with data
         raise ValueError("inconsistency in data detected")
 
-    for ii in range(len(scan_list1)):
-        scan1 = scan_list1[ii]
-        scan2 = scan_list2[ii]
-        mass_list1 = scan1.mass_list
-        mass_list2 = scan2.mass_list
-        if len(mass_list1) != len(mass_list2):
-            print(f"\n Different number of points detected in scan no. {ii:d}")
-            print(" Data sets are different.")
-            return
+    # The scan lengths are found once and reused for the RMSD calculation.
+    scan_lengths1 = numpy.fromiter((len(scan) for scan in scan_list1), dtype=numpy.intp, count=len(scan_list1))
+    scan_lengths2 = numpy.fromiter((len(scan) for scan in scan_list2), dtype=numpy.intp, count=len(scan_list2))
+
+    different = numpy.flatnonzero(scan_lengths1 != scan_lengths2)
+    if len(different):
+        print(f"\n Different number of points detected in scan no. {different[0]:d}")
+        print(" Data sets are different.")
+        return
 
     print("OK")
 
@@ -91,27 +93,48 @@ def diff(data1: GCMS_data, data2: GCMS_data):
     print(" Calculating maximum RMSD for m/z values and intensities ...", end='')
     sys.stdout.flush()
 
-    max_mass_rmsd = 0.0
-    max_intensity_rmsd = 0.0
-
-    for ii in range(len(scan_list1)):
-        scan1 = scan_list1[ii]
-        scan2 = scan_list2[ii]
-        mass_list1 = scan1.mass_list
-        mass_list2 = scan2.mass_list
-        intensity_list1 = scan1.intensity_list
-        intensity_list2 = scan2.intensity_list
-        mass_rmsd = rmsd(mass_list1, mass_list2)
-        if mass_rmsd > max_mass_rmsd:
-            max_mass_rmsd = mass_rmsd
-        intensity_rmsd = rmsd(intensity_list1, intensity_list2)
-        if intensity_rmsd > max_intensity_rmsd:
-            max_intensity_rmsd = intensity_rmsd
+    max_mass_rmsd = _max_scan_rmsd(
+        [scan.mass_list for scan in scan_list1],
+        [scan.mass_list for scan in scan_list2],
+        scan_lengths1,
+    )
+    max_intensity_rmsd = _max_scan_rmsd(
+        [scan.intensity_list for scan in scan_list1],
+        [scan.intensity_list for scan in scan_list2],
+        scan_lengths1,
+    )
 
     print(f"\n   Max m/z RMSD: {max_mass_rmsd:.2e}")
     print(f"   Max intensity RMSD: {max_intensity_rmsd:.2e}")
 
 
+def _max_scan_rmsd(
+        values1: List[numpy.ndarray],
+        values2: List[numpy.ndarray],
+        scan_lengths: numpy.ndarray,
+) -> float:
+    """
+    Returns the largest RMSD between corresponding scans of two data sets.
+
+    Empty scans are skipped.
+
+    :param values1: The values of each scan in the first data set.
+    :param values2: The values of each scan in the second data set.
+    :param scan_lengths: The number of values in each scan, which must be the same for both data sets.
+    """
+
+    not_empty = scan_lengths > 0
+    if not not_empty.any():
+        return 0.0
+
+    # Sum the squared differences of each scan in one reduction over the concatenated values.
+    squared_diff = (numpy.concatenate(values1) - numpy.concatenate(values2))**2
+    starts = numpy.cumsum(scan_lengths) - scan_lengths
+    totals = numpy.add.reduceat(squared_diff, starts[not_empty])
+
+    return float(numpy.sqrt(totals / scan_lengths[not_empty]).max())
+
+
 def ic_window_points(
         ic: IonChromatogram.IonChromatogram,
         window_sele: Union[int, str],
@@ -139,7 +162,7 @@ def ic_window_points(
             if window_sele % 2 == 0:
                 raise ValueError("window must be an odd number of points")
             else:
-                points = int(math.floor(window_sele * 0.5))
+                points = window_sele // 2
         else:
             points = window_sele
     else:
@@ -149,7 +172,8 @@ def ic_window_points(
         if half_window:
             time = time * 0.5
 
-        points = int(math.floor(time / time_step))
+        # int() truncates, which is the same as flooring for the positive times used here
+        points = int(time / time_step)
 
     if half_window:
         if points < 1:
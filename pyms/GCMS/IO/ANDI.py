@@ -29,6 +29,7 @@ import os
 import typing
 
 # 3rd party
+import numpy
 from netCDF4 import Dataset  # type: ignore
 
 try:
@@ -70,36 +71,32 @@ def ANDI_reader(file_name: PathLike) -> GCMS_data:
     if not isinstance(file_name, (str, pathlib.Path)):
         raise TypeError("'file_name' must be a string or a pathlib.Path object")
 
-    rootgrp = Dataset(file_name, "r+", format="NETCDF3_CLASSIC")
     # TODO: find out if netCDF4 throws specific errors that we can use here
+    with Dataset(file_name, "r") as rootgrp:
+        # Return plain arrays rather than masked arrays.
+        rootgrp.set_auto_mask(False)
 
-    print(f" -> Reading netCDF file '{file_name}'")
+        print(f" -> Reading netCDF file '{file_name}'")
 
-    scan_list = []
-    mass = rootgrp.variables[__MASS_STRING][:]
-    intensity = rootgrp.variables[__INTENSITY_STRING][:]
+        # Keep the point data as float64 arrays; each scan is a view into them.
+        mass = numpy.asarray(rootgrp.variables[__MASS_STRING][:], dtype=numpy.float64)
+        intensity = numpy.asarray(rootgrp.variables[__INTENSITY_STRING][:], dtype=numpy.float64)
 
-    scan_lengths = rootgrp.variables["point_count"]  # The number of data points in each scan
+        # The number of data points in each scan
+        scan_lengths = numpy.asarray(rootgrp.variables[__POINT_COUNT][:], dtype=numpy.intp)
 
-    mass_values = mass.tolist()
-    intensity_values = intensity.tolist()
+        time_list = rootgrp.variables[__TIME_STRING][:].tolist()
 
-    if len(mass_values) != len(intensity_values):
+    if len(mass) != len(intensity):
         raise ValueError("The lengths of the mass and intensity lists differ!")
 
-    offset = 0
-    for length in scan_lengths:
-        mass_list = mass_values[offset:offset + length]
-        assert len(mass_values[offset:offset + length]) == length
-        intensity_list = intensity_values[offset:offset + length]
-        assert len(intensity_values[offset:offset + length]) == length
-        scan_list.append(Scan(mass_list, intensity_list))
-        offset += length
+    offsets = numpy.cumsum(scan_lengths)
+    assert len(offsets) == 0 or offsets[-1] == len(mass)
 
-    assert offset == len(mass_values)
-
-    time = rootgrp.variables[__TIME_STRING][:]
-    time_list = time.tolist()
+    scan_list = [
+        Scan(mass_list, intensity_list)
+        for mass_list, intensity_list in zip(numpy.split(mass, offsets[:-1]), numpy.split(intensity, offsets[:-1]))
+    ]
 
     # sanity check
     if len(time_list) != len(scan_list):
@@ -32,6 +32,8 @@ import pathlib
 import os
 from typing import Any, List, MutableMapping, Union
 
+# 3rd party
+import numpy
 
 # this package
 from pyms.GCMS.Class import GCMS_data
@@ -63,8 +65,8 @@ def JCAMP_reader(file_name: PathLike) -> GCMS_data:
     file_name = pathlib.Path(prepare_filepath(file_name, mkdirs=False))
 
     print(f" -> Reading JCAMP file {file_name.as_posix()!r}")
-    lines_list = file_name.read_lines()
-    data: List[float] = []
+    lines_list = file_name.read_text().splitlines()
+    block_lines: List[str] = []  # data lines of the current scan
     page_idx = 0
     xydata_idx = 0
     time_list = []
@@ -79,84 +81,53 @@ def JCAMP_reader(file_name: PathLike) -> GCMS_data:
             # if prefix == 0:
             if line.startswith("##"):
                 # key word or information
-                fields = line.split('=', 1)
-                fields[0] = fields[0].lstrip("##").upper()
-                fields[1] = fields[1].strip()
+                key, _, value = line.partition('=')
+                key = key.lstrip("##").upper()
+                value = value.strip()
 
-                if "PAGE" in fields[0]:
-                    if "T=" in fields[1]:
+                if "PAGE" in key:
+                    if "T=" in value:
                         # PAGE contains retention time starting with T=
                         # FileConverter Pro style
-                        time = float(fields[1].lstrip("T="))  # rt for the scan to be submitted
+                        time = float(value.lstrip("T="))  # rt for the scan to be submitted
                         time_list.append(time)
                     page_idx = page_idx + 1
-                elif "RETENTION_TIME" in fields[0]:
+                elif "RETENTION_TIME" in key:
                     # OpenChrom style
-                    time = float(fields[1])  # rt for the scan to be submitted
+                    time = float(value)  # rt for the scan to be submitted
 
                     # Check to make sure time is not already in the time list;
                     # Can happen when both ##PAGE and ##RETENTION_TIME are specified
                     if time_list[-1] != time:
                         time_list.append(time)
 
-                elif fields[0] in xydata_tags:
+                elif key in xydata_tags:
                     xydata_idx = xydata_idx + 1
 
-                elif fields[0] in header_info_fields:
-                    if fields[1].isdigit():
-                        header_info[fields[0]] = int(fields[1])
-                    elif is_float(fields[1]):
-                        header_info[fields[0]] = float(fields[1])
+                elif key in header_info_fields:
+                    if value.isdigit():
+                        header_info[key] = int(value)
+                    elif is_float(value):
+                        header_info[key] = float(value)
                     else:
-                        header_info[fields[0]] = fields[1]
+                        header_info[key] = value
 
             # elif prefix == -1:
             else:
                 # Line doesn't start with ##
                 # data
                 if page_idx > 1 or xydata_idx > 1:
-                    if len(data) % 2 == 1:
-                        # TODO: This means the data is not in x, y pairs
-                        #  Make a better error message
-                        raise ValueError("data not in pair !")
-                    mass_list = []
-                    intensity_list = []
-                    for i in range(len(data) // 2):
-                        mass_list.append(data[i * 2])
-                        intensity_list.append(data[i * 2 + 1])
-                    if len(mass_list) != len(intensity_list):
-                        raise ValueError("len(mass_list) is not equal to len(intensity_list)")
-                    scan_list.append(Scan(mass_list, intensity_list))
-                    data = []
-                    data_sub = line.strip().split(',')
-                    for item in data_sub:
-                        if not len(item.strip()) == 0:
-                            data.append(float(item.strip()))
+                    scan_list.append(_scan_from_xy_block(block_lines))
+                    block_lines = [line]
                     if page_idx > 1:
                         page_idx = 1
                     if xydata_idx > 1:
                         xydata_idx = 1
                 else:
-                    data_sub = line.strip().split(',')
-                    for item in data_sub:
-                        if not len(item.strip()) == 0:
-                            data.append(float(item.strip()))
-
-    if len(data) % 2 == 1:
-        # TODO: This means the data is not in x, y pairs
-        #  Make a better error message
-        raise ValueError("data not in pair !")
+                    block_lines.append(line)
 
     # get last scan
-    mass = []
-    intensity = []
-    for i in range(len(data) // 2):
-        mass.append(data[i * 2])
-        intensity.append(data[i * 2 + 1])
-
-    if len(mass) != len(intensity):
-        raise ValueError("len(mass) is not equal to len(intensity)")
-    scan_list.append(Scan(mass, intensity))
+    scan_list.append(_scan_from_xy_block(block_lines))
 
     # sanity check
     time_len = len(time_list)
@@ -167,3 +138,36 @@ def JCAMP_reader(file_name: PathLike) -> GCMS_data:
         raise ValueError(f"Number of time points ({time_len}) does not equal the number of scans ({scan_len})")
 
     return GCMS_data(time_list, scan_list)
+
+
+def _scan_from_xy_block(lines: List[str]) -> Scan:
+    """
+    Create a :class:`~pyms.Spectrum.Scan` from the ``x, y`` data lines of one scan.
+
+    :param lines: The data lines of the scan.
+    """
+
+    data = _parse_xy_block(lines)
+    if len(data) % 2 == 1:
+        # TODO: This means the data is not in x, y pairs
+        #  Make a better error message
+        raise ValueError("data not in pair !")
+
+    # The masses and intensities alternate; take each as a strided view.
+    return Scan(data[0::2], data[1::2])
+
+
+def _parse_xy_block(lines: List[str]) -> numpy.ndarray:
+    """
+    Parse the comma-separated data lines of one scan into a flat array of values.
+
+    :param lines: The data lines of the scan.
+    """
+
+    # Blank fields are skipped, as in a line ending with a comma.
+    items = ','.join(lines).replace(',', ' ').split()
+
+    try:
+        return numpy.array(items, dtype=numpy.float64)
+    except ValueError as e:
+        raise ValueError(f"Malformed data in JCAMP file: {e}")
@@ -24,8 +24,7 @@ Mixins for PyMassSpec Classes.
 ################################################################################
 
 # stdlib
-import math
-from typing import List, Optional
+from typing import List, Optional, Union
 from warnings import warn
 
 # 3rd party
@@ -171,7 +170,7 @@ class IntensityArrayMixin:
 class GetIndexTimeMixin:
     _min_rt: float
     _max_rt: float
-    _time_list: List[float]
+    _time_list: Union[List[float], numpy.ndarray]
 
     def get_index_at_time(self, time: float) -> int:
         """
@@ -196,19 +195,15 @@ class GetIndexTimeMixin:
                 f"time {time:.2f} is out of bounds (min: {self._min_rt:.2f}, max: {self._max_rt:.2f})"
             )
 
-        time_list = self._time_list
-        time_diff_min = self._max_rt
-        ix_match = -1
-
-        for ix in range(len(time_list)):
-
-            time_diff = math.fabs(time - time_list[ix])
+        # Retention times are in ascending order, so bisect and then pick
+        # the nearer neighbour (the earlier one if equally near).
+        time_array = numpy.asarray(self._time_list)
+        ix = int(numpy.searchsorted(time_array, time))
 
-            if time_diff < time_diff_min:
-                ix_match = ix
-                time_diff_min = time_diff
+        if ix > 0 and (ix == len(time_array) or time_array[ix] - time >= time - time_array[ix - 1]):
+            return ix - 1
 
-        return ix_match
+        return ix
 
     def get_time_at_index(self, ix: int) -> float:
         """
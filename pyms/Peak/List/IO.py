@@ -25,6 +25,7 @@ Functions related to storing and loading a list of Peak objects.
 ################################################################################
 
 # stdlib
+import pickle
 from pathlib import Path
 from typing import List, Sequence
 
@@ -40,7 +41,7 @@ __all__ = ["store_peaks", "load_peaks"]
 def store_peaks(
         peak_list: Sequence[Peak],
         file_name: Path,
-        protocol: int = 1,
+        protocol: int = pickle.HIGHEST_PROTOCOL,
 ):
     """
     Store the list of peak objects.
@@ -213,10 +213,7 @@ def sele_peaks_by_rt(
     if rt_lo >= rt_hi:
         raise ValueError("lower retention time limit must be less than upper")
 
-    peaks_sele = []
+    rts = numpy.fromiter((peak.rt for peak in peaks), dtype=numpy.float64, count=len(peaks))
+    selected = numpy.flatnonzero((rts > rt_lo) & (rts < rt_hi))
 
-    for peak in peaks:
-        rt = peak.rt
-        if rt_lo < rt < rt_hi:
-            peaks_sele.append(peak)
-    return peaks_sele
+    return [peaks[idx] for idx in selected]
@@ -101,11 +101,11 @@ class Scan(pymsBaseClass, MassListMixin):
         if len(mass_list) != len(intensity_list):
             raise ValueError("'mass_list' is not the same size as 'intensity_list'")
 
-        sorted_mass_list = sorted(mass_list)
+        mass_steps = numpy.diff(mass_list)
 
-        if not (sorted_mass_list == mass_list).all():
+        if (mass_steps < 0).any():
             # Mass list isn't in ascending order
-            if sorted_mass_list[::-1] == mass_list:
+            if (mass_steps <= 0).all():
                 # Mass list is in descending order
                 mass_list = mass_list[::-1]
                 intensity_list = intensity_list[::-1]
@@ -120,8 +120,8 @@ Please report this at https://github.com/domdfcoding/pymassspec/issues and uploa
         self._intensity_list = intensity_list
 
         if self:
-            self._min_mass = min(mass_list)
-            self._max_mass = max(mass_list)
+            self._min_mass = mass_list.min()
+            self._max_mass = mass_list.max()
         else:
             self._min_mass = None
             self._max_mass = None
@@ -524,13 +524,18 @@ def normalize_mass_spec(
     :return: The normalized mass spectrum
     """  # noqa: D400
 
+    intensity_array = numpy.asarray(mass_spec.mass_spec, dtype=numpy.float64)
+
     if relative_to is None:
-        relative_to = max(mass_spec.intensity_list)
+        relative_to = intensity_array.max()
+
+    if relative_to == 0:
+        raise ValueError("Cannot normalize a mass spectrum relative to an intensity of zero.")
 
-    normalized_intensity_list = [(x / float(relative_to)) * max_intensity for x in mass_spec.intensity_list]
+    normalized_intensity_list = (intensity_array / float(relative_to)) * max_intensity
 
     if isinstance(max_intensity, int):
-        normalized_intensity_list = [round(x) for x in normalized_intensity_list]
+        normalized_intensity_list = numpy.round(normalized_intensity_list).astype(numpy.int64)
 
     if inplace:
         mass_spec.intensity_list = normalized_intensity_list
@@ -26,12 +26,11 @@ General I/O functions.
 # stdlib
 import gzip
 import pathlib
-import pickle
 import os
 from typing import Any, List, Union, cast
 
 # this package
-from pyms.Utils.Utils import _list_types, _pickle_dump_path, is_number, is_path
+from pyms.Utils.Utils import _list_types, _pickle_dump_path, _pickle_load_path, is_number, is_path
 
 __all__ = ["prepare_filepath", "dump_object", "load_object", "file_lines", "save_data"]
 PathLike = Union[str, pathlib.Path, os.PathLike]
@@ -96,10 +95,7 @@ def load_object(file_name: PathLike) -> object:
     if not is_path(file_name):
         raise TypeError("'file_name' must be a string or a PathLike object")
 
-    file_name = prepare_filepath(file_name)
-
-    with file_name.open("wb") as fp:
-        return pickle.load(fp)
+    return _pickle_load_path(prepare_filepath(file_name, mkdirs=False))
 
 
 def file_lines(file_name: PathLike, strip: bool = False) -> List[str]:
@@ -24,6 +24,7 @@ General utility functions.
 ################################################################################
 
 # stdlib
+import mmap
 import os
 import pathlib
 import pickle
@@ -43,6 +44,10 @@ _list_types = (Sequence, numpy.core.ndarray)
 _path_types = (str, os.PathLike, pathlib.Path)
 _number_types = (int, float, signedinteger)
 
+# Buffer size for pickle file I/O. Large dumps (e.g. experiments with many
+# peaks) would otherwise make a write syscall for every 8 KiB.
+_pickle_buffer_size = 1 << 20
+
 
 def is_path(obj: Any) -> bool:
     """
@@ -91,10 +96,16 @@ def is_number(obj: Any) -> bool:
 
 
 def _pickle_load_path(filename: pathlib.Path, *args, **kwargs):
-    with filename.open("rb") as fp:
-        return pickle.load(fp, *args, **kwargs)
+    with filename.open("rb", buffering=_pickle_buffer_size) as fp:
+        if os.fstat(fp.fileno()).st_size < _pickle_buffer_size:
+            return pickle.load(fp, *args, **kwargs)
+
+        # Unpickle large files straight from the page cache rather than
+        # copying them through the file object's buffer.
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return pickle.loads(mapped, *args, **kwargs)
 
 
-def _pickle_dump_path(filename: pathlib.Path, data: Any, *args, **kwargs):
-    with filename.open("wb") as fp:
-        return pickle.dump(data, fp, *args, **kwargs)
+def _pickle_dump_path(filename: pathlib.Path, data: Any, protocol: int = pickle.HIGHEST_PROTOCOL, **kwargs):
+    with filename.open("wb", buffering=_pickle_buffer_size) as fp:
+        return pickle.dump(data, fp, protocol, **kwargs)
@@ -23,6 +23,7 @@ from copy import deepcopy
 from typing import cast
 
 # 3rd party
+import numpy
 import pytest
 from coincidence.regressions import AdvancedFileRegressionFixture
 from domdf_python_tools.paths import PathPlus
@@ -357,7 +358,7 @@ def test_dump(andi: GCMS_data, tmp_pathplus: PathPlus):
 
 def test_time_list(andi: GCMS_data):
 	time = andi.time_list
-	assert isinstance(time, list)
+	assert isinstance(time, numpy.ndarray)
 	# number of retention times
 	assert len(time) == 9865
 	# retention time of 1st scan:
@@ -20,18 +20,34 @@
 
 # stdlib
 import os
+import subprocess
+import sys
+import warnings
+from types import SimpleNamespace
 
 # 3rd party
+import numpy  # type: ignore[import]
 import pytest
 from domdf_python_tools.paths import PathPlus
 from matplotlib import axes, figure  # type: ignore[import]
 from matplotlib import pyplot as plt
+from matplotlib.collections import LineCollection  # type: ignore[import]
 
 # this package
-from pyms.Display import Display
+import pyms.Display
+from pyms.Display import (
+		ClickEventHandler,
+		Display,
+		invert_mass_spec,
+		plot_head2tail,
+		plot_ic,
+		plot_mass_spec,
+		plot_peaks,
+		)
 from pyms.GCMS.Class import GCMS_data
 from pyms.IntensityMatrix import IntensityMatrix
 from pyms.IonChromatogram import IonChromatogram
+from pyms.Peak import Peak
 from pyms.Spectrum import MassSpectrum
 
 # this package
@@ -49,6 +65,13 @@ check_images = pytest.mark.mpl_image_compare(
 		)
 
 
+@pytest.fixture(autouse=True)
+def close_figures():
+	# Close the figures each test creates, so they don't accumulate over the session
+	yield
+	plt.close("all")
+
+
 def test_Display():
 	no_args = Display()
 	assert isinstance(no_args.fig, figure.Figure)
@@ -274,3 +297,264 @@ def test_do_plotting_warning():
 	expected = """No plots have been created.
 Please call a plotting function before calling 'do_plotting()'"""
 	assert args[0] == expected
+
+
+def test_do_plotting_click_callback():
+	test_plot = Display()
+	test_plot.plot_ic(IonChromatogram([1.0, 5.0, 2.0], [10.0, 11.0, 12.0]), label="IC")
+	test_plot.plot_peaks([Peak(11.0, MassSpectrum([50, 51], [10.0, 20.0]))])
+
+	test_plot.do_plotting()
+	first_cid = test_plot._click_cid
+	assert first_cid is not None
+
+	# Plotting again must replace the existing callback rather than adding another
+	test_plot.plot_peaks([Peak(12.0, MassSpectrum([50, 51], [10.0, 20.0]))])
+	test_plot.do_plotting()
+	assert test_plot._click_cid is not None
+	assert first_cid not in test_plot.fig.canvas.callbacks.callbacks["button_press_event"]
+
+
+def test_plot_mass_spec_collection():
+	fig, ax = plt.subplots()
+	plot = plot_mass_spec(ax, MassSpectrum([50, 51, 52], [10.0, 30.0, 20.0]), width=2)
+
+	assert isinstance(plot, LineCollection)
+	assert len(plot.get_segments()) == 3
+	assert ax.get_xlim() == (49, 53)
+	plt.close(fig)
+
+
+def test_invert_mass_spec():
+	mass_spec = MassSpectrum([50, 51, 52], [10.0, 30.0, 20.0])
+
+	inverted = invert_mass_spec(mass_spec)
+	assert inverted is not mass_spec
+	assert list(inverted.intensity_list) == [-10.0, -30.0, -20.0]
+	assert list(mass_spec.intensity_list) == [10.0, 30.0, 20.0]
+
+	assert invert_mass_spec(mass_spec, inplace=True) is mass_spec
+	assert list(mass_spec.intensity_list) == [-10.0, -30.0, -20.0]
+
+
+def test_click_event_handler_mass_spec(capsys):
+	intensities = [3.0, 1.0, 4.0, 1.0, 5.0, 9.0]
+	peak_list = [
+			Peak(11.0, MassSpectrum(range(50, 56), intensities)),
+			Peak(30.0, MassSpectrum(range(50, 56), [i * 3 for i in intensities])),
+			]
+	handler = ClickEventHandler(peak_list, fig=plt.figure())
+
+	handler.onclick(SimpleNamespace(xdata=11.0, button=3))
+	ms_fig = handler.ms_fig
+	assert ms_fig is not None
+	assert handler.ms_ax.get_title() == "Mass Spectrum at RT 11.0"
+	assert handler.ms_ax.get_ylim()[1] < 27
+
+	# The pop-up is reused, with the previous spectrum replaced and the axes rescaled
+	handler.onclick(SimpleNamespace(xdata=30.0, button=3))
+	assert handler.ms_fig is ms_fig
+	assert len(handler.ms_ax.collections) == 1
+	assert handler.ms_ax.get_title() == "Mass Spectrum at RT 30.0"
+	assert handler.ms_ax.get_ylim()[1] > 27
+
+	assert capsys.readouterr().out.count("RT: ") == 2
+	plt.close("all")
+
+
+def test_plot_peaks_heights():
+	fig, ax = plt.subplots()
+	peak_list = [
+			Peak(12.0, MassSpectrum([50, 51], [10.0, 20.0])),
+			Peak(15.0, MassSpectrum([50, 51], [5.0, 2.5])),
+			]
+	lines = plot_peaks(ax, peak_list)
+
+	assert len(lines) == 1
+	assert lines[0].get_xydata().tolist() == [[12.0, 30.0], [15.0, 7.5]]
+	plt.close(fig)
+
+
+def test_do_plotting_legend_loc():
+	test_plot = Display()
+	test_plot.plot_ic(IonChromatogram([1.0, 5.0, 2.0], [10.0, 11.0, 12.0]), label="IC")
+
+	test_plot.do_plotting()
+	assert test_plot.ax.get_legend()._loc == 1  # upper right
+
+	test_plot.do_plotting(legend_loc="lower left")
+	assert test_plot.ax.get_legend()._loc == 3
+
+
+def test_save_chart(tmp_pathplus: PathPlus):
+	test_plot = Display()
+	(line, ) = test_plot.plot_ic(IonChromatogram([1.0, 5.0, 2.0], [10.0, 11.0, 12.0]), label="IC")
+
+	test_plot.save_chart(str(tmp_pathplus / "chart"), filetypes=["png", "svg"], dpi=72)
+
+	assert line.get_rasterized()
+	assert (tmp_pathplus / "chart.png").is_file()
+	assert (tmp_pathplus / "chart.svg").is_file()
+
+
+def test_get_5_largest():
+	intensities = [3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0, 5.5, 3.5, 0.5, 8.0]
+	assert Display.get_5_largest(intensities) == [5, 11, 7, 8, 4]
+	assert Display.get_5_largest([2.0, 7.0]) == [1, 0]
+	assert Display.get_5_largest([]) == []
+
+
+def test_get_n_largest():
+	handler = ClickEventHandler([], fig=plt.figure(), n_intensities=3)
+	assert handler.get_n_largest([3.0, 1.0, 4.0, 1.0, 5.0, 9.0]) == [5, 4, 2]
+	plt.close("all")
+
+
+def test_plot_mass_spec_xlim():
+	fig, ax = plt.subplots()
+	mass_spec = MassSpectrum([50, 51, 52], [10.0, 30.0, 20.0])
+	# Out of order masses, as can happen after the mass list is edited
+	mass_spec._mass_list = numpy.array([51, 60, 45])
+	plot_mass_spec(ax, mass_spec)
+
+	assert ax.get_xlim() == (44, 61)
+	plt.close(fig)
+
+
+def test_plot_head2tail():
+	fig, ax = plt.subplots()
+	top_plot, bottom_plot = plot_head2tail(
+			ax,
+			MassSpectrum([50, 51, 52], [10.0, 40.0, 20.0]),
+			MassSpectrum([50, 51, 52], [5.0, 1.0, 2.0]),
+			)
+
+	assert isinstance(top_plot, LineCollection)
+	assert isinstance(bottom_plot, LineCollection)
+	assert ax.get_ylim() == pytest.approx((-110, 110))
+	plt.close(fig)
+
+
+def test_plot_ic_minutes():
+	fig, ax = plt.subplots()
+	(line, ) = plot_ic(ax, IonChromatogram([1.0, 5.0, 2.0], [60.0, 90.0, 120.0]), minutes=True)
+
+	assert line.get_xdata().tolist() == [1.0, 1.5, 2.0]
+	assert ax.get_xlim() == (1.0, 2.0)
+	plt.close(fig)
+
+
+def test_click_event_handler_peak_selection(capsys):
+	peak_list = [
+			Peak(30.0, MassSpectrum([50, 51], [1.0, 2.0])),
+			Peak(10.0, MassSpectrum([50, 51], [3.0, 4.0])),
+			Peak(20.0, MassSpectrum([50, 51], [5.0, 6.0])),
+			]
+	handler = ClickEventHandler(peak_list, fig=plt.figure(), n_intensities=1)
+
+	handler.onclick(SimpleNamespace(xdata=10.02, button=1))
+	assert capsys.readouterr().out == "RT: 10.0\nMass\t Intensity\n51\t 4.0\n"
+
+	handler.onclick(SimpleNamespace(xdata=25.0, button=1))
+	assert capsys.readouterr().out == "No Peak at this point\n"
+
+	# Click outside the axes
+	handler.onclick(SimpleNamespace(xdata=None, button=1))
+	assert capsys.readouterr().out == "No Peak at this point\n"
+	plt.close("all")
+
+
+def test_do_plotting_redraw(monkeypatch):
+	test_plot = Display()
+	test_plot.plot_ic(IonChromatogram([1.0, 5.0, 2.0], [10.0, 11.0, 12.0]), label="IC")
+
+	draws = []
+	monkeypatch.setattr(test_plot.fig.canvas, "draw", lambda: draws.append(1))
+
+	test_plot.do_plotting()
+	assert len(draws) == 1
+
+	# Nothing has changed
+	test_plot.do_plotting()
+	assert len(draws) == 1
+
+	test_plot.do_plotting("Title")
+	assert len(draws) == 2
+
+	test_plot.plot_ic(IonChromatogram([2.0, 3.0, 1.0], [10.0, 11.0, 12.0]), label="IC 2")
+	test_plot.do_plotting("Title")
+	assert len(draws) == 3
+	assert [text.get_text() for text in test_plot.ax.get_legend().get_texts()] == ["IC", "IC 2"]
+
+
+def test_plot_ics():
+	test_plot = Display()
+	ics = [
+			IonChromatogram([1.0, 5.0, 2.0], [10.0, 11.0, 12.0]),
+			IonChromatogram([3.0, 8.0, 2.0], [10.0, 11.0, 13.0]),
+			]
+	plot = test_plot.plot_ics(ics, label="ICs")
+
+	assert isinstance(plot, LineCollection)
+	assert len(plot.get_segments()) == 2
+	assert len(plot.get_colors()) == 2
+	assert test_plot.ax.get_xlim() == (10.0, 13.0)
+	assert test_plot.ax.get_ylim()[0] == 0
+
+	for obj in [[], [test_string], test_list_ints]:
+		with pytest.raises(TypeError):
+			test_plot.plot_ics(obj)
+
+
+def test_save_chart_raster_formats(tmp_pathplus: PathPlus):
+	test_plot = Display()
+	test_plot.plot_ic(IonChromatogram([1.0, 5.0, 2.0], [10.0, 11.0, 12.0]), label="IC")
+	test_plot.fig.savefig(tmp_pathplus / "expected.png")
+
+	test_plot.save_chart(str(tmp_pathplus / "chart"), filetypes=["png", "jpg"])
+
+	# 3rd party
+	from PIL import Image  # type: ignore[import]
+
+	with Image.open(tmp_pathplus / "expected.png") as expected, Image.open(tmp_pathplus / "chart.png") as png:
+		assert (numpy.asarray(png) == numpy.asarray(expected)).all()
+
+		with Image.open(tmp_pathplus / "chart.jpg") as jpg:
+			assert jpg.size == png.size
+
+
+def test_plot_peaks_lines():
+	fig, ax = plt.subplots()
+	peak_list = [
+			Peak(12.0, MassSpectrum([50, 51], [10.0, 20.0])),
+			Peak(15.0, MassSpectrum([50, 51], [5.0, 2.5])),
+			]
+	lines = plot_peaks(ax, peak_list, style="lines")
+
+	assert len(lines) == 1
+	assert isinstance(lines[0], LineCollection)
+	assert [segment.tolist() for segment in lines[0].get_segments()] == [
+			[[12.0, 0.0], [12.0, 1.0]],
+			[[15.0, 0.0], [15.0, 1.0]],
+			]
+	assert ax.get_xlim()[0] <= 12.0
+	assert ax.get_xlim()[1] >= 15.0
+	plt.close(fig)
+
+
+def test_import_does_not_load_pyplot():
+	code = "import sys, pyms.Display; print('matplotlib.pyplot' in sys.modules)"
+	output = subprocess.check_output([sys.executable, "-c", code])
+	assert output.strip() == b"False"
+
+
+def test_Display_deprecated(monkeypatch):
+	monkeypatch.setattr(pyms.Display, "_display_deprecation_warned", False)
+
+	with pytest.warns(DeprecationWarning, match="__init__ is deprecated as of 2.2.8"):
+		Display()
+
+	# Only the first instantiation warns
+	with warnings.catch_warnings():
+		warnings.simplefilter("error")
+		Display()
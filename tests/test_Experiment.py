@@ -19,6 +19,7 @@
 #############################################################################
 
 # stdlib
+import copy
 from typing import List
 
 # 3rd party
@@ -27,7 +28,8 @@ from domdf_python_tools.paths import PathPlus
 
 # this package
 from pyms.Experiment import Experiment, load_expr, read_expr_list
-from pyms.Peak.Class import Peak
+from pyms.Peak import Peak
+from pyms.Spectrum import MassSpectrum
 from pyms.Utils.Utils import is_sequence_of
 
 # this package
@@ -150,3 +152,66 @@ def test_read_expr_list(filtered_peak_list: List[Peak], expr_filename: PathPlus,
 		read_expr_list("not-an-experiment.expr")
 	with pytest.raises(FileNotFoundError, match="No such file or directory: .*__init__.py.*"):
 		read_expr_list("__init__.py")
+
+
+def test_copy():
+	peaks = [Peak(60.0 * (idx + 1), MassSpectrum([50, 51], [10.0, 20.0])) for idx in range(3)]
+
+	expr = Experiment("expr", tuple(peaks))
+	assert isinstance(expr.peak_list, list)
+	assert expr.peak_list == peaks
+
+	for expr_copy in (copy.copy(expr), copy.deepcopy(expr)):
+		assert isinstance(expr_copy, Experiment)
+		assert expr_copy == expr
+		assert expr_copy.expr_code == "expr"
+		assert expr_copy.peak_list is not expr.peak_list
+
+		expr_copy.sele_rt_range(["1.5m", "3.5m"])
+		assert len(expr_copy) == 2
+		assert len(expr) == 3
+		assert expr_copy != expr
+
+	assert Experiment("other", peaks) != expr
+
+	copied = copy.deepcopy([expr, expr])
+	assert copied[0] is copied[1]
+	assert copied[0] is not expr
+
+
+def test_pickle(tmp_pathplus: PathPlus):
+	peaks = [Peak(60.0 * (idx + 1), MassSpectrum([50, 51], [10.0, 20.0])) for idx in range(3)]
+	expr = Experiment("expr", peaks)
+
+	expr.dump(tmp_pathplus / "expr.expr")
+	loaded = load_expr(tmp_pathplus / "expr.expr")
+	assert loaded == expr
+	assert loaded.expr_code == "expr"
+	assert loaded.expr_code is expr.expr_code
+	assert Experiment(''.join(["ex", "pr"]), peaks).expr_code is expr.expr_code
+
+	# Pickles with the attribute dictionary as the state, as written by earlier versions
+	legacy = Experiment.__new__(Experiment)
+	legacy.__setstate__({"_expr_code": "expr", "_peak_list": peaks})
+	assert legacy == expr
+
+	assert not hasattr(expr, "__dict__")
+
+
+def test_read_expr_list_order(tmp_pathplus: PathPlus):
+	filenames = []
+
+	for idx in range(5):
+		peak = Peak(60.0 * (idx + 1), MassSpectrum([50, 51], [10.0, 20.0 * idx]))
+		filename = tmp_pathplus / f"expr_{idx}.expr"
+		Experiment(f"expr_{idx}", [peak]).dump(filename)
+		filenames.append(str(filename))
+
+	(tmp_pathplus / "read_expr_list.txt").write_lines([*filenames[::-1], ''])
+	expr_list = read_expr_list(tmp_pathplus / "read_expr_list.txt")
+
+	assert [expr.expr_code for expr in expr_list] == [f"expr_{idx}" for idx in range(4, -1, -1)]
+	assert [expr.peak_list[0].rt for expr in expr_list] == [300.0, 240.0, 180.0, 120.0, 60.0]
+
+	(tmp_pathplus / "empty_expr_list.txt").write_text('')
+	assert read_expr_list(tmp_pathplus / "empty_expr_list.txt") == []
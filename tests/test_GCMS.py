@@ -0,0 +1,244 @@
+#############################################################################
+#                                                                           #
+#    PyMassSpec software for processing of mass-spectrometry data           #
+#    Copyright (C) 2019-2020 Dominic Davis-Foster                           #
+#                                                                           #
+#    This program is free software; you can redistribute it and/or modify   #
+#    it under the terms of the GNU General Public License version 2 as      #
+#    published by the Free Software Foundation.                             #
+#                                                                           #
+#    This program is distributed in the hope that it will be useful,        #
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of         #
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          #
+#    GNU General Public License for more details.                           #
+#                                                                           #
+#    You should have received a copy of the GNU General Public License      #
+#    along with this program; if not, write to the Free Software            #
+#    Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.              #
+#                                                                           #
+#############################################################################
+
+# 3rd party
+import numpy
+import pytest
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from pyms.GCMS.Class import GCMS_data
+from pyms.GCMS.Function import diff, ic_window_points
+from pyms.IonChromatogram import IonChromatogram
+from pyms.Spectrum import Scan
+
+
+@pytest.fixture()
+def gcms_data() -> GCMS_data:
+	scans = [
+			Scan([50.0, 51.0, 52.0], [10.0, 20.0, 30.0]),
+			Scan([], []),
+			Scan([49.5, 60.0], [5.0, 7.0]),
+			Scan([51.0], [1.0]),
+			Scan([], []),
+			]
+	return GCMS_data([1.0, 2.0, 3.0, 4.0, 5.0], scans)
+
+
+def test_tic(gcms_data: GCMS_data):
+	assert list(gcms_data.tic.intensity_array) == [60.0, 0.0, 12.0, 1.0, 0.0]
+	assert list(gcms_data.tic.time_list) == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+	empty = GCMS_data([1.0, 2.0, 3.0], [Scan([], []), Scan([], []), Scan([], [])])
+	assert list(empty.tic.intensity_array) == [0.0, 0.0, 0.0]
+
+
+def test_min_max_mass(gcms_data: GCMS_data):
+	assert gcms_data.min_mass == 49.5
+	assert gcms_data.max_mass == 60.0
+
+	# The first scan being empty doesn't hide the other scans' masses
+	data = GCMS_data([1.0, 2.0, 3.0], [Scan([], []), Scan([50.0, 55.0], [1.0, 2.0]), Scan([45.0], [3.0])])
+	assert data.min_mass == 45.0
+	assert data.max_mass == 55.0
+
+	empty = GCMS_data([1.0, 2.0, 3.0], [Scan([], []), Scan([], []), Scan([], [])])
+	assert empty.min_mass is None
+	assert empty.max_mass is None
+
+
+def test_info(capsys, gcms_data: GCMS_data):
+	gcms_data.info(print_scan_n=True)
+	expected = """ Data retention time range: 0.017 min -- 0.083 min
+ Time step: 1.000 s (std=0.000 s)
+ Number of scans: 5
+ Minimum m/z measured: 49.500
+ Maximum m/z measured: 60.000
+3
+0
+2
+1
+0
+ Mean number of m/z values per scan: 1
+ Median number of m/z values per scan: 1
+"""
+	assert capsys.readouterr().out == expected
+
+
+def test_get_index_at_time(gcms_data: GCMS_data):
+	assert gcms_data.get_index_at_time(1.0) == 0
+	assert gcms_data.get_index_at_time(2.4) == 1
+	assert gcms_data.get_index_at_time(2.6) == 2
+	# Equally near to two scans
+	assert gcms_data.get_index_at_time(3.5) == 2
+	assert gcms_data.get_index_at_time(5.0) == 4
+	assert isinstance(gcms_data.get_index_at_time(5.0), int)
+
+	with pytest.raises(TypeError):
+		gcms_data.get_index_at_time("3.0")  # type: ignore[arg-type]
+	with pytest.raises(IndexError):
+		gcms_data.get_index_at_time(0.5)
+	with pytest.raises(IndexError):
+		gcms_data.get_index_at_time(5.5)
+
+
+def test_time_step():
+	data = GCMS_data([1.0, 2.0, 4.0, 5.0], [Scan([50.0], [1.0])] * 4)
+	assert data.time_step == pytest.approx(4 / 3)
+	assert data.time_step_std == pytest.approx(0.57735026)
+	assert data.min_rt == 1.0
+	assert data.max_rt == 5.0
+
+	with pytest.raises(ValueError, match="Retention times are not in ascending order!"):
+		GCMS_data([1.0, 2.0, 2.0, 5.0], [Scan([50.0], [1.0])] * 4)
+	with pytest.raises(ValueError, match="At least three retention times are required"):
+		GCMS_data([1.0, 2.0], [Scan([50.0], [1.0])] * 2)
+
+
+def test_trim(gcms_data: GCMS_data, capsys):
+	gcms_data.trim(2, 4)
+	assert capsys.readouterr().out == "Trimming data to between 2 and 5 scans\n"
+
+	assert len(gcms_data) == 4
+	assert list(gcms_data.time_list) == [2.0, 3.0, 4.0, 5.0]
+	assert list(gcms_data.tic.intensity_array) == [0.0, 12.0, 1.0, 0.0]
+	assert gcms_data.min_mass == 49.5
+	assert gcms_data.min_rt == 2.0
+	assert gcms_data.max_rt == 5.0
+
+
+def test_write(gcms_data: GCMS_data, tmp_pathplus: PathPlus):
+	gcms_data.write(tmp_pathplus / "gcms_data")
+
+	assert (tmp_pathplus / "gcms_data.I.csv").read_text() == (
+			"10.0000,20.0000,30.0000\n\n5.0000,7.0000\n1.0000\n\n"
+			)
+	assert (tmp_pathplus / "gcms_data.mz.csv").read_text() == (
+			"50.0000,51.0000,52.0000\n\n49.5000,60.0000\n51.0000\n\n"
+			)
+
+
+def test_write_intensities_stream(gcms_data: GCMS_data, tmp_pathplus: PathPlus):
+	gcms_data.write_intensities_stream(tmp_pathplus / "intensities.txt")
+
+	assert (tmp_pathplus / "intensities.txt").read_text() == (
+			" 10.0000\n 20.0000\n 30.0000\n  5.0000\n  7.0000\n  1.0000\n"
+			)
+
+
+def test_scan_list(gcms_data: GCMS_data):
+	scans = gcms_data.scan_list
+	assert isinstance(scans, list)
+	assert len(scans) == 5
+	assert scans[0] == Scan([50.0, 51.0, 52.0], [10.0, 20.0, 30.0])
+
+	# A new list each time, so callers can't alter the data's scans
+	scans.pop()
+	assert len(gcms_data.scan_list) == 5
+
+
+def test_equality(gcms_data: GCMS_data):
+	assert gcms_data == GCMS_data(gcms_data.time_list, gcms_data.scan_list)
+	assert gcms_data != GCMS_data([1.0, 2.0, 3.0, 4.0, 6.0], gcms_data.scan_list)
+	assert gcms_data != GCMS_data(gcms_data.time_list, [Scan([], [])] * 5)
+	assert gcms_data != "GCMS_data"
+
+
+def test_time_list_array():
+	scans = [Scan([50.0], [1.0])] * 3
+
+	for time_list in (numpy.array([1, 2, 3]), numpy.array([1.0, 2.0, 3.0], dtype=numpy.float32)):
+		data = GCMS_data(time_list, scans)
+		assert list(data.time_list) == [1.0, 2.0, 3.0]
+
+	for time_list in (numpy.array(["1", "2", "3"]), numpy.array([True, False, True]), numpy.array([None] * 3)):
+		with pytest.raises(TypeError, match="'time_list' must be a Sequence of numbers"):
+			GCMS_data(time_list, scans)
+
+
+def test_too_few_scans():
+	# The standard deviation of the time step needs at least two time steps
+	for n_scans in (1, 2):
+		with pytest.raises(ValueError, match="At least three retention times are required"):
+			GCMS_data([float(time) for time in range(1, n_scans + 1)], [Scan([50.0], [1.0])] * n_scans)
+
+
+def test_tic_lazy(gcms_data: GCMS_data):
+	tic = gcms_data.tic
+	assert gcms_data.tic is tic
+
+	gcms_data.trim(2, 4)
+	assert gcms_data.tic is not tic
+	assert list(gcms_data.tic.intensity_array) == [0.0, 12.0, 1.0, 0.0]
+
+
+def test_time_list(gcms_data: GCMS_data):
+	time_list = gcms_data.time_list
+	assert isinstance(time_list, numpy.ndarray)
+	assert list(time_list) == [1.0, 2.0, 3.0, 4.0, 5.0]
+	assert isinstance(time_list[0], float)
+
+	# A copy, not a view of the data's times
+	time_list[0] = 0.0
+	assert gcms_data.time_list[0] == 1.0
+
+
+def test_diff(capsys, gcms_data: GCMS_data):
+	scans = [
+			Scan([50.0, 51.0, 52.0], [10.0, 20.0, 33.0]),
+			Scan([], []),
+			Scan([49.5, 60.0], [5.0, 9.0]),
+			Scan([51.0], [1.0]),
+			Scan([], []),
+			]
+	diff(gcms_data, GCMS_data([1.0, 2.0, 3.0, 4.0, 5.0], scans))
+	expected = """ Data sets have the same number of time points.
+   Time RMSD: 0.00e+00
+ Checking for consistency in scan lengths ...OK
+ Calculating maximum RMSD for m/z values and intensities ...
+   Max m/z RMSD: 0.00e+00
+   Max intensity RMSD: 1.73e+00
+"""
+	assert capsys.readouterr().out == expected
+
+	scans[2] = Scan([49.5], [5.0])
+	diff(gcms_data, GCMS_data([1.0, 2.0, 3.0, 4.0, 5.0], scans))
+	assert capsys.readouterr().out.endswith(
+			"...\n Different number of points detected in scan no. 2\n Data sets are different.\n"
+			)
+
+
+def test_ic_window_points():
+	ic = IonChromatogram(numpy.ones(20), numpy.arange(20) * 0.1)
+
+	assert ic_window_points(ic, 7) == 7
+	assert ic_window_points(ic, 7, half_window=True) == 3
+	assert ic_window_points(ic, "1s") == 10
+	assert ic_window_points(ic, "0.7s", half_window=True) == 3
+	assert isinstance(ic_window_points(ic, "1s"), int)
+
+	with pytest.raises(ValueError, match="window must be an odd number of points"):
+		ic_window_points(ic, 6, half_window=True)
+	with pytest.raises(ValueError, match="window too small"):
+		ic_window_points(ic, 1, half_window=True)
+	with pytest.raises(ValueError, match="window too small"):
+		ic_window_points(ic, "0.1s")
+	with pytest.raises(TypeError):
+		ic_window_points(ic, 1.5)  # type: ignore[arg-type]
@@ -23,6 +23,7 @@ from copy import deepcopy
 from typing import cast
 
 # 3rd party
+import numpy
 import pytest
 from coincidence.regressions import AdvancedFileRegressionFixture
 from domdf_python_tools.paths import PathPlus
@@ -48,6 +49,32 @@ def test_JCAMP_reader():
 		JCAMP_reader(test_string)
 
 
+def test_JCAMP_reader_malformed(tmp_pathplus: PathPlus):
+	jcamp_file = tmp_pathplus / "malformed.jdx"
+	jcamp_file.write_lines([
+			"##TITLE=malformed",
+			"##PAGE=T=1.0",
+			"##DATA TABLE=(XY..XY), PEAKS",
+			"50, 10.0, 51, 20.0,",
+			"##PAGE=T=2.0",
+			"##DATA TABLE=(XY..XY), PEAKS",
+			"50, 10.0, 51, abc",
+			"##PAGE=T=3.0",
+			"##DATA TABLE=(XY..XY), PEAKS",
+			"50, 10.0",
+			"##END=",
+			])
+
+	with pytest.raises(ValueError, match="Malformed data in JCAMP file: could not convert string to float: 'abc'"):
+		JCAMP_reader(jcamp_file)
+
+	jcamp_file.write_text(jcamp_file.read_text().replace("abc", "30.0"))
+	data = JCAMP_reader(jcamp_file)
+	assert list(data.time_list) == [1.0, 2.0, 3.0]
+	assert list(data.scan_list[0].intensity_list) == [10.0, 20.0]
+	assert list(data.scan_list[1].intensity_list) == [10.0, 30.0]
+
+
 # def test_JCAMP_OpenChrom_reader(pyms_datadir):
 # todo
 
@@ -260,7 +287,7 @@ def test_dump(data: GCMS_data, tmp_pathplus: PathPlus):
 
 def test_time_list(data: GCMS_data):
 	time = data.time_list
-	assert isinstance(time, list)
+	assert isinstance(time, numpy.ndarray)
 	# number of retention times
 	assert len(time) == 2103
 	# retention time of 1st scan:
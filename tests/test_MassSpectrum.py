@@ -21,6 +21,7 @@
 # stdlib
 import copy
 import pathlib
+import pickle
 from typing import Any, Type
 
 # 3rd party
@@ -29,7 +30,8 @@ import requests
 
 # this package
 from pyms.IntensityMatrix import IntensityMatrix
-from pyms.Spectrum import MassSpectrum
+from pyms.Spectrum import MassSpectrum, normalize_mass_spec
+from pyms.Utils.Utils import _pickle_load_path
 
 # this package
 from .constants import *
@@ -263,3 +265,61 @@ def test_from_mz_int_pairs():
 
 	with pytest.raises(ValueError, match="could not convert string to float: 'abc'"):
 		MassSpectrum.from_mz_int_pairs([("abc", "123")])  # type: ignore[list-item]
+
+
+def test_normalize_mass_spec():
+	mass_spec = MassSpectrum([50, 51, 52], [10.0, 40.0, 25.0])
+
+	normalized = normalize_mass_spec(mass_spec)
+	assert normalized is not mass_spec
+	assert list(normalized.intensity_list) == [25, 100, 62]
+	assert list(mass_spec.intensity_list) == [10.0, 40.0, 25.0]
+
+	normalized = normalize_mass_spec(mass_spec, relative_to=80.0, max_intensity=1000.0)
+	assert list(normalized.intensity_list) == [125.0, 500.0, 312.5]
+
+	assert normalize_mass_spec(mass_spec, inplace=True, max_intensity=1.0) is mass_spec
+	assert list(mass_spec.intensity_list) == [0.25, 1.0, 0.625]
+
+
+def test_normalize_mass_spec_zero():
+	mass_spec = MassSpectrum([50, 51, 52], [0.0, 0.0, 0.0])
+
+	with pytest.raises(ValueError, match="Cannot normalize a mass spectrum relative to an intensity of zero."):
+		normalize_mass_spec(mass_spec)
+
+	with pytest.raises(ValueError, match="Cannot normalize a mass spectrum relative to an intensity of zero."):
+		normalize_mass_spec(MassSpectrum([50], [10.0]), relative_to=0)
+
+
+def test_dump(tmp_pathplus):
+	mass_spec = MassSpectrum([50, 51, 52], [10.0, 40.0, 25.0])
+	mass_spec.dump(tmp_pathplus / "ms_dump.dat")
+
+	# PROTO opcode followed by the protocol number
+	assert (tmp_pathplus / "ms_dump.dat").read_bytes()[:2] == bytes([0x80, pickle.HIGHEST_PROTOCOL])
+	assert _pickle_load_path(tmp_pathplus / "ms_dump.dat") == mass_spec
+
+
+def test_dump_large(tmp_pathplus):
+	# Large enough to be loaded through a memory map
+	mass_spec = MassSpectrum(list(range(1, 100_001)), [float(x % 1000) for x in range(100_000)])
+	mass_spec.dump(tmp_pathplus / "ms_dump.dat")
+
+	assert (tmp_pathplus / "ms_dump.dat").stat().st_size > 1 << 20
+	assert _pickle_load_path(tmp_pathplus / "ms_dump.dat") == mass_spec
+
+
+def test_mass_list_order():
+	mass_spec = MassSpectrum([52, 51, 50], [1.0, 2.0, 3.0])
+	assert list(mass_spec.mass_list) == [50, 51, 52]
+	assert list(mass_spec.intensity_list) == [3.0, 2.0, 1.0]
+	assert mass_spec.min_mass == 50
+	assert mass_spec.max_mass == 52
+
+	with pytest.warns(UserWarning, match="Unknown sort order for mass list"):
+		mass_spec = MassSpectrum([51, 50, 52], [1.0, 2.0, 3.0])
+
+	assert list(mass_spec.mass_list) == [51, 50, 52]
+	assert mass_spec.min_mass == 50
+	assert mass_spec.max_mass == 52
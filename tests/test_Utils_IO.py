@@ -0,0 +1,19 @@
+# stdlib
+import pickle
+
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from pyms.Utils.IO import dump_object, load_object
+
+
+def test_dump_load_object(tmp_pathplus: PathPlus):
+	obj = {"masses": [50, 51, 52], "intensities": (1.0, 2.0, 3.0)}
+
+	dump_object(obj, tmp_pathplus / "object.dat")
+	assert (tmp_pathplus / "object.dat").read_bytes()[:2] == bytes([0x80, pickle.HIGHEST_PROTOCOL])
+
+	assert load_object(tmp_pathplus / "object.dat") == obj
+	# Loading must not truncate the file
+	assert load_object(tmp_pathplus / "object.dat") == obj